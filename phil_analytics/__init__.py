@@ -101,7 +101,7 @@ def get_supported_payers():
         "USDOL", "VSP", "WA ST & Other", "WA ST L&I", "Zelis"
     ]
 
-def quick_pipeline(payer_folder, max_files=None, input_folder=None, output_folder=None, mapping_file=None, save_combined=True, payments_filter=None):
+def quick_pipeline(payer_folder, max_files=None, input_folder=None, output_folder=None, mapping_file=None, save_combined=True, payments_filter=None, generate_markdown=True, max_workers=None):
     """
     Quick pipeline runner for common use cases.
 
@@ -113,6 +113,8 @@ def quick_pipeline(payer_folder, max_files=None, input_folder=None, output_folde
         mapping_file (str, optional): Override default mapping file path
         save_combined (bool): Whether to save a _combined.xlsx file for testing
         payments_filter (str, optional): Semicolon-separated string of payment numbers for filtered markdown
+        generate_markdown (bool): Whether to write the EFTs markdown files
+        max_workers (int, optional): Worker processes for building, tagging and rendering EFTs (None or 1 runs sequentially)
 
     Returns:
         dict: Results containing analytics data and file paths
@@ -137,7 +139,9 @@ def quick_pipeline(payer_folder, max_files=None, input_folder=None, output_folde
         mapping_file=mapping_file,
         max_files=max_files,
         save_combined=save_combined,
-        payments_filter=payments_filter
+        payments_filter=payments_filter,
+        generate_markdown=generate_markdown,
+        max_workers=max_workers
     )
     return pipeline.run_full_pipeline()
 
@@ -10,8 +10,18 @@ import pandas as pd
 import json
 from openpyxl import load_workbook
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List
 from .exceptions import FileNotFoundError, ValidationError, DataProcessingError
+from .utils import TEXT_DTYPE
+
+if TYPE_CHECKING:
+    from .excel_data_processor import Service
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
 
 
 class ExcelCombiner:
@@ -118,37 +128,39 @@ class ExcelCombiner:
                 print(f"📄 Processing: {file_name}")
 
                 try:
-                    # Use openpyxl exactly like the original - with data_only=False
-                    wb = load_workbook(file_path, data_only=False)
-
-                    for sheet in wb.worksheets:
-                        sheet_data = []
-
-                        for i, row in enumerate(sheet.iter_rows(), start=1):
-                            row_data = []
-
-                            # Extract cell values exactly like original
-                            for cell in row:
-                                row_data.append(cell.value)
-
-                            # Handle headers exactly like original
-                            if first_file and i == 1:
-                                expected_headers = row_data.copy()
+                    # Use openpyxl exactly like the original - with data_only=False - but stream the
+                    # sheets in read-only mode rather than building every cell object up front
+                    wb = load_workbook(file_path, read_only=True, data_only=False, keep_links=False)
+
+                    try:
+                        for sheet in wb.worksheets:
+                            sheet_data = []
+
+                            for i, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                                # Extract cell values exactly like original
+                                row_data = list(row)
+
+                                # Handle headers exactly like original
+                                if first_file and i == 1:
+                                    expected_headers = row_data
+                                    sheet_data.append(row_data)
+                                    continue
+
+                                # Skip header rows from subsequent files
+                                if not first_file and i == 1:
+                                    headers = row_data
+                                    if headers != expected_headers:
+                                        print(f"⚠️ Header mismatch in file: {file_name}")
+                                    continue
+
+                                # Add the data row
                                 sheet_data.append(row_data)
-                                continue
-
-                            # Skip header rows from subsequent files
-                            if not first_file and i == 1:
-                                headers = row_data.copy()
-                                if headers != expected_headers:
-                                    print(f"⚠️ Header mismatch in file: {file_name}")
-                                continue
-
-                            # Add the data row
-                            sheet_data.append(row_data)
 
-                        # Add this sheet's data to all_data
-                        all_data.extend(sheet_data)
+                            # Add this sheet's data to all_data
+                            all_data.extend(sheet_data)
+                    finally:
+                        # Read-only workbooks hold the file open until closed
+                        wb.close()
 
                     first_file = False
                     self.file_count += 1
@@ -178,12 +190,10 @@ class ExcelCombiner:
                 self.combined_data = pd.DataFrame(data_rows, columns=headers)
 
                 # Convert all columns to string to preserve Excel TEXT formatting
+                # (Arrow-backed when pyarrow is installed, so the scrubber's string ops run in Arrow kernels),
+                # replacing 'None' strings and missing cells with empty strings in the same per-column pass
                 for col in self.combined_data.columns:
-                    self.combined_data[col] = self.combined_data[col].astype(str)
-
-                # Replace 'None' strings with empty strings
-                self.combined_data = self.combined_data.replace('None', '')
-                self.combined_data = self.combined_data.fillna('')
+                    self.combined_data[col] = self._to_text_column(self.combined_data[col])
 
                 self.total_rows = len(self.combined_data)
 
@@ -211,6 +221,26 @@ class ExcelCombiner:
                 operation="dataframe_creation"
             )
 
+    @staticmethod
+    def _to_text_column(column: pd.Series) -> pd.Series:
+        """
+        Convert a column to text, with 'None' strings and missing cells as empty strings.
+
+        Args:
+            column (pd.Series): Column as built from the worksheet rows
+
+        Returns:
+            pd.Series: Text column with no missing values
+        """
+        column = column.astype(TEXT_DTYPE)
+        if pa is None:
+            return column.replace('None', '').fillna('')
+
+        # Fill nulls and blank out 'None' directly on the Arrow buffer instead of through the pandas wrappers
+        values = pc.fill_null(pa.array(column), '')
+        values = pc.if_else(pc.equal(values, 'None'), '', values)
+        return pd.Series(pd.array(values, dtype=TEXT_DTYPE), index=column.index, name=column.name)
+
     def _save_combined_file(self) -> None:
         """Save the combined data to a _combined.xlsx file in the output folder."""
         if self.combined_data is None:
@@ -484,7 +514,7 @@ class JsonCombiner:
         return self.save_combined_json()
 
 
-def transform_json_service_to_data_object(json_service: Dict, json_claim: Dict) -> Dict:
+def transform_json_service_to_data_object(json_service: Dict, json_claim: Dict) -> "Service":
     """
     Transform JSON service structure to match our data object service format.
 
@@ -493,8 +523,11 @@ def transform_json_service_to_data_object(json_service: Dict, json_claim: Dict)
         json_claim (Dict): Claim data from JSON (for context)
 
     Returns:
-        Dict: Service object in our data format
+        Service: Service object in our data format
     """
+    # Imported here so the Excel combine step does not depend on the data object module
+    from .excel_data_processor import Service
+
     # Build codes string from JSON adjustments
     codes_parts = []
 
@@ -505,8 +538,6 @@ def transform_json_service_to_data_object(json_service: Dict, json_claim: Dict)
                 # For now, we'll use placeholder description since JSON doesn't include it
                 codes_parts.append(f"{code} () -${amount}")
 
-    codes_string = "; ".join(codes_parts)
-
     # Handle remarks (JSON remarks are typically empty based on your example)
     remarks = []
     for remark in json_service.get("remarks", []):
@@ -516,20 +547,18 @@ def transform_json_service_to_data_object(json_service: Dict, json_claim: Dict)
             remarks.extend(remark.keys())
 
     # Transform to our data object format
-    service_obj = {
-        "clm_sts": str(json_claim.get("clm_status", "")).strip(),
-        "posting_sts": "Not Posted",  # We're only updating Not Posted services
-        "cpt4": str(json_service.get("proc", "")).strip(),
-        "txn_status": "",  # Not available in JSON
-        "description": "",  # Not available in JSON
-        "bill_amt": str(json_service.get("billed", "0.00")).strip(),
-        "paid_amt": str(json_service.get("prov_pd", "0.00")).strip(),
-        "ded_amt": "",  # May need to calculate from adjustments
-        "codes": codes_string,  # Now a formatted string
-        "remarks": remarks
-    }
-
-    return service_obj
+    return Service(
+        clm_sts=str(json_claim.get("clm_status", "")).strip(),
+        posting_sts="Not Posted",  # We're only updating Not Posted services
+        cpt4=str(json_service.get("proc", "")).strip(),
+        txn_status="",  # Not available in JSON
+        description="",  # Not available in JSON
+        bill_amt=str(json_service.get("billed", "0.00")).strip(),
+        paid_amt=str(json_service.get("prov_pd", "0.00")).strip(),
+        ded_amt="",  # May need to calculate from adjustments
+        codes=tuple(codes_parts),  # One formatted code per entry
+        remarks=tuple(remarks)
+    )
 
 
 def update_service_codes_from_json(current_codes: str, json_adjustments: List[Dict]) -> str:
@@ -616,51 +645,50 @@ def update_service_codes_from_json(current_codes: str, json_adjustments: List[Di
     return "; ".join(updated_parts)
 
 
-def compare_and_update_service(current_service: Dict, json_service_data: Dict) -> Dict:
+def compare_and_update_service(current_service: "Service", json_service_data: Dict) -> "Service":
     """
     Compare current service with JSON data and update if different.
     Only updates services with posting_sts = "Not Posted".
 
     Args:
-        current_service (Dict): Current service from our data object
+        current_service (Service): Current service from our data object
         json_service_data (Dict): JSON service data with service, claim, remit
 
     Returns:
-        Dict: Updated service object
+        Service: Updated service object (the same object when nothing changed)
     """
     # Only update if posting status is "Not Posted"
-    if current_service.get("posting_sts", "").strip() != "Not Posted":
+    if current_service.posting_sts.strip() != "Not Posted":
         return current_service
 
     json_service = json_service_data["service"]
-    json_claim = json_service_data["claim"]
 
-    # Create updated service
-    updated_service = current_service.copy()
+    # Services are immutable, so collect the changed fields and replace them at the end
+    updates = {}
 
     # Update amounts if different
     json_bill_amt = str(json_service.get("billed", "0.00")).strip()
     json_paid_amt = str(json_service.get("prov_pd", "0.00")).strip()
 
-    if updated_service.get("bill_amt", "").strip() != json_bill_amt:
-        print(f"   📝 Updating bill_amt: {updated_service.get('bill_amt')} → {json_bill_amt}")
-        updated_service["bill_amt"] = json_bill_amt
+    if current_service.bill_amt.strip() != json_bill_amt:
+        print(f"   📝 Updating bill_amt: {current_service.bill_amt} → {json_bill_amt}")
+        updates["bill_amt"] = json_bill_amt
 
-    if updated_service.get("paid_amt", "").strip() != json_paid_amt:
-        print(f"   📝 Updating paid_amt: {updated_service.get('paid_amt')} → {json_paid_amt}")
-        updated_service["paid_amt"] = json_paid_amt
+    if current_service.paid_amt.strip() != json_paid_amt:
+        print(f"   📝 Updating paid_amt: {current_service.paid_amt} → {json_paid_amt}")
+        updates["paid_amt"] = json_paid_amt
 
-    # Update codes if different
-    current_codes = updated_service.get("codes", "")
+    # Update codes if different (the codes string helper works on the "; "-joined form)
+    current_codes = "; ".join(current_service.codes)
     updated_codes = update_service_codes_from_json(current_codes, json_service.get("adjustments", []))
 
     if current_codes != updated_codes:
         print(f"   📝 Updating codes:")
         print(f"      Old: {current_codes}")
         print(f"      New: {updated_codes}")
-        updated_service["codes"] = updated_codes
+        updates["codes"] = tuple(updated_codes.split("; ")) if updated_codes else ()
 
-    return updated_service
+    return current_service._replace(**updates) if updates else current_service
 
 
 def find_matching_json_data(encounter_num: str, claim_status: str, cpt4: str,
@@ -5,12 +5,152 @@ This module processes Excel spreadsheet data while maintaining text formatting.
 Creates data objects with EFT -> Payment -> Encounter -> Service hierarchy.
 """
 
+import sys
+import numpy as np
 import pandas as pd
 import openpyxl
+from openpyxl.cell.cell import TYPE_ERROR
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
-from collections import defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter, itemgetter
 import re
+from .utils import TEXT_DTYPE
+
+try:
+    # Rust-based XLSX reader, used when installed since it parses sheets far faster than openpyxl
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Workbook readers accepted by ExcelDataObjectCreator
+EXCEL_ENGINES = ("auto", "calamine", "openpyxl")
+
+
+@lru_cache(maxsize=65536)
+def _parse_amount(amount: str) -> Optional[float]:
+    """
+    Parse an amount string to float, caching results since amount text repeats heavily across services.
+
+    Args:
+        amount (str): Amount text as stored on the service
+
+    Returns:
+        Optional[float]: Parsed amount, or None if the text is not a number
+    """
+    try:
+        return float(amount)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _encounter_claim_status(clm_sts: str) -> str:
+    """
+    Get an encounter's status from its raw Clm Sts Cod, removing parenthetical text
+    (e.g. "1 (Processed as Primary)" -> "1") and keeping any other value as is.
+
+    Args:
+        clm_sts (str): Raw Clm Sts Cod the encounter was grouped on
+
+    Returns:
+        str: Interned encounter status
+    """
+    if '(' in clm_sts:
+        clm_sts = clm_sts.partition('(')[0].strip()
+    return sys.intern(clm_sts)
+
+
+class Service(NamedTuple):
+    """
+    Service line within an encounter.
+    All values are strings to preserve Excel TEXT formatting.
+    """
+    clm_sts: str
+    posting_sts: str
+    cpt4: str
+    txn_status: str
+    description: str
+    bill_amt: str
+    paid_amt: str
+    ded_amt: str
+    codes: Tuple[str, ...]
+    remarks: Tuple[str, ...]
+
+
+# Field getter used when gathering CPT4s across services
+SERVICE_CPT4 = attrgetter("cpt4")
+
+# Source columns read for each service row, in the order _create_service_objects unpacks them
+SERVICE_COLUMNS = ['Posting Sts', 'CPT4', 'Txn Status', 'Description', 'Bill Amt', 'Pd Amt', 'Ded Amt', 'Reason Cd', 'Remark Codes']
+
+# PLA amount pattern: one compiled alternation, anchored at the start so alternatives are tried in
+# priority order (dollar forms, then labelled numbers, then any decimal) and each takes its first hit
+PLA_AMOUNT_PATTERN = re.compile(
+    r'^(?:'
+    r'.*?\$(?P<dollar>-?\d+\.?\d*)'  # $123.45 or $-123.45
+    r'|.*?(?P<neg_dollar>-?)\$(?P<neg_dollar_amt>\d+\.?\d*)'  # -$123.45
+    r'|.*?Amt:\s*\$?(?P<amt>-?\d+\.?\d*)'  # Amt: $123.45 or Amt: 123.45
+    r'|.*?Amount:\s*\$?(?P<amount>-?\d+\.?\d*)'  # Amount: $123.45 or Amount: 123.45
+    r'|.*?found:\s*(?P<found>-?\d+\.?\d*)'  # found: 123.45
+    r'|.*?applied:\s*(?P<applied>-?\d+\.?\d*)'  # applied: 123.45
+    r'|.*?:\s*(?P<trailing>-?\d+\.?\d*)$'  # ends with : 123.45
+    r'|.*?(?P<decimal>-?\d+\.\d{2})'  # any decimal number
+    r')',
+    re.DOTALL
+)
+
+# PLA description label and the canonical prefix stripped from PLA descriptions
+PLA_LABEL = "Provider Level Adjustment"
+PLA_FOUND_PREFIX = "Provider Level Adjustment found: "
+
+# Service pairs for charge mismatch checking, and each CPT4's opposite within its pair
+SERVICE_PAIRS = [("99202", "99212"), ("99203", "99213"), ("99204", "99214"), ("99205", "99215"), ("99206", "99216")]
+OPPOSITE_CPT4 = {**dict(SERVICE_PAIRS), **{b: a for a, b in SERVICE_PAIRS}}
+
+# Primary (1, 19), secondary (2, 20) and tertiary (21, plus any 3x) claim statuses
+NON_RECOUPMENT_STATUSES = frozenset(["1", "19", "2", "20", "21"])
+
+# Not-posted service descriptions and the encounter tag each one maps to
+NOT_POSTED_DESCRIPTION_TAGS = {
+    "Encounter payer not found.": "enc_payer_not_found",
+    "Charge mismatch on amount.": "multiple_to_one",
+    "Multiple payments found for the same line item.": "multiple_to_one",
+    "Service line payments do not sum to claim level payment.": "svc_no_match_clm",
+    "Charge mismatch on CPT4.": "chg_mismatch_cpt4",
+}
+
+# Bit per reason/remark code checked on secondary services, so each code group test is a mask test
+CODE_BIT = {"N408": 1, "PR96": 2, "CO45": 4, "OA23": 8, "CO94": 16, "OA94": 32}
+CODES_N408_PR96 = CODE_BIT["N408"] | CODE_BIT["PR96"]
+CODES_CO45_OA23 = CODE_BIT["CO45"] | CODE_BIT["OA23"]
+CODES_CO94_OA94 = CODE_BIT["CO94"] | CODE_BIT["OA94"]
+CODES_PR96 = CODE_BIT["PR96"]
+
+# Bit per row kind, classified once over the whole sheet; an L6 PLA row is also an encounter row,
+# and a service row is an encounter row with a CPT4
+ROW_PLA = 1
+ROW_L6 = 2
+ROW_ENCOUNTER = 4
+ROW_SERVICE = 8
+
+# Every sheet column the data object is built from; anything else is dropped at load
+SOURCE_COLUMNS = frozenset(
+    ['File', 'PAYER FOLDER', 'EFT NUM', 'PRACTICE ID', 'Chk Nbr', 'Clm Nbr', 'Enc Nbr', 'Clm Sts Cod']
+    + SERVICE_COLUMNS
+)
+
+# Match and service columns stripped of surrounding whitespace once at load time. The grouping keys
+# (EFT NUM, PRACTICE ID, Chk Nbr, Enc Nbr, Clm Sts Cod) stay raw, since EFTs, payments and encounters
+# are grouped on the values exactly as written; they are only stripped for blank tests
+STRIPPED_COLUMNS = ['Clm Nbr'] + SERVICE_COLUMNS
+
+# Short-vocabulary columns stored as categoricals after stripping (EFT/payment keys stay text,
+# since per-EFT row slices are pickled to workers and would each carry every category)
+CATEGORICAL_COLUMNS = ['Clm Sts Cod', 'Posting Sts', 'Txn Status', 'Reason Cd', 'Remark Codes']
 
 
 class ExcelDataObjectCreator:
@@ -19,7 +159,8 @@ class ExcelDataObjectCreator:
     Handles grouping of rows by EFT NUM, PMT NUM, PLAs, Encounters, and Services.
     """
 
-    def __init__(self, file_path: str, process_limit: Optional[int] = None, eft_filter: Optional[List[str]] = None):
+    def __init__(self, file_path: str, process_limit: Optional[int] = None, eft_filter: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None, verbose: bool = False, engine: str = "auto"):
         """
         Initialize the processor with the Excel file path and optional processing limit.
 
@@ -27,43 +168,67 @@ class ExcelDataObjectCreator:
             file_path (str): Path to the Excel file
             process_limit (int, optional): Maximum number of rows to process
             eft_filter (List[str], optional): List of EFT numbers to filter for
+            max_workers (int, optional): Number of worker processes for building EFT objects (None or 1 runs sequentially)
+            verbose (bool): Print per-EFT and per-payment progress lines (summaries and warnings always print)
+            engine (str): Workbook reader - "calamine", "openpyxl", or "auto" to use calamine when installed
         """
+        if engine not in EXCEL_ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(EXCEL_ENGINES)}")
+        if engine == "calamine" and CalamineWorkbook is None:
+            raise ValueError("The calamine engine requires the python-calamine package")
+
         self.file_path = Path(file_path)
         self.process_limit = process_limit
         self.eft_filter = set(eft_filter) if eft_filter else None
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.engine = engine if engine != "auto" else ("calamine" if CalamineWorkbook is not None else "openpyxl")
         self.df = None
+        self._row_kinds = None
+        self._eft_index = None
+        self._columns = frozenset()
         self.payer_name = None
         self.data_object = {}
         self.missing_encounter_efts = []
         self._load_data()
 
+    def __getstate__(self):
+        """
+        Drop the full DataFrame and results when pickling for worker processes.
+        Workers only receive the rows for the EFT they build.
+        """
+        state = self.__dict__.copy()
+        state['df'] = None
+        state['_row_kinds'] = None
+        state['_eft_index'] = None
+        state['data_object'] = {}
+        return state
+
     def _load_data(self):
         """
         Load Excel data while preserving text formatting.
-        Uses openpyxl engine to maintain Excel TEXT formatting as strings.
+        Reads with calamine when installed (openpyxl otherwise) and keeps every cell as text.
         """
         try:
-            # Use openpyxl engine to preserve text formatting
-            # Set dtype=str for all columns to ensure text is treated as strings
-            self.df = pd.read_excel(
-                self.file_path,
-                engine='openpyxl',
-                dtype=str,  # This ensures all columns are treated as strings
-                na_filter=False  # Prevents pandas from converting empty cells to NaN
-            )
-
-            # Apply process limit if specified
-            if self.process_limit:
-                self.df = self.df.head(self.process_limit)
+            # Read the first sheet as text without building the full workbook DOM
+            self.df = self._read_sheet_as_text()
 
             # Extract payer name from filename (remove _Scrubbed.xlsx)
             self.payer_name = self.file_path.stem.replace('_Scrubbed', '')
 
-            # Clean column names (strip whitespace)
-            self.df.columns = self.df.columns.str.strip()
+            # Every row subset shares the sheet's columns, so helpers check presence against this set
+            self._columns = frozenset(self.df.columns)
 
-            # Fill NaN values with empty strings to maintain string dtype
-            self.df = self.df.fillna('')
+            # Every column is already text; strip the match and service columns once so helpers can compare directly
+            for col in STRIPPED_COLUMNS:
+                if col in self._columns:
+                    self.df[col] = self.df[col].str.strip()
+            for col in CATEGORICAL_COLUMNS:
+                if col in self._columns:
+                    self.df[col] = self.df[col].astype('category')
+
+            # Row kinds for the whole sheet, indexed by row label so later row subsets can slice them
+            self._row_kinds = self._compute_row_kinds(self.df)
 
             print(f"Loaded {len(self.df)} rows from {self.file_path}")
             print(f"Columns: {list(self.df.columns)}")
@@ -79,6 +244,93 @@ class ExcelDataObjectCreator:
             print(f"Error loading data: {e}")
             raise
 
+    def _read_sheet_as_text(self) -> pd.DataFrame:
+        """
+        Read the first worksheet with the configured engine.
+        With calamine the sheet is parsed in Rust (up to process_limit rows); with openpyxl
+        it is streamed row by row from a read-only workbook. Error cells (e.g. #N/A) read
+        as '' under both engines, as they do with read_excel.
+
+        Returns:
+            pd.DataFrame: Used sheet columns with stripped names and all-text values
+        """
+        if self.engine == "calamine":
+            workbook = CalamineWorkbook.from_path(str(self.file_path))
+            try:
+                nrows = self.process_limit + 1 if self.process_limit else None
+                rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False, nrows=nrows)
+            finally:
+                workbook.close()
+            return self._rows_to_text_frame(map(tuple, rows))
+
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            # Blank error cells by their cell type rather than their text, so a text cell reading "#N/A" is kept
+            rows = (
+                tuple(None if cell.data_type == TYPE_ERROR else cell.value for cell in row)
+                for row in workbook.worksheets[0].iter_rows()
+            )
+            return self._rows_to_text_frame(rows)
+        finally:
+            workbook.close()
+
+    def _rows_to_text_frame(self, rows_iter: Iterator[tuple]) -> pd.DataFrame:
+        """
+        Build the all-text DataFrame from raw sheet rows, header first.
+        Every cell is converted to a string and empty cells become '', matching
+        read_excel(dtype=str, na_filter=False). Columns outside SOURCE_COLUMNS are
+        never converted. Honors process_limit while iterating.
+
+        Args:
+            rows_iter (Iterator[tuple]): Sheet rows as tuples of raw cell values
+
+        Returns:
+            pd.DataFrame: Used sheet columns with stripped names and all-text values
+        """
+        header = [
+            '' if value is None else self._excel_cell_text(value).strip()
+            for value in next(rows_iter, ())
+        ]
+
+        # Only materialize the columns the data object is built from
+        keep = [index for index, name in enumerate(header) if name in SOURCE_COLUMNS]
+        width = len(header)
+
+        data = []
+        last_non_blank = 0
+        for row in rows_iter:
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            data.append(['' if row[index] is None else self._excel_cell_text(row[index]) for index in keep])
+            if any(value not in (None, '') for value in row[:width]):
+                last_non_blank = len(data)
+            if self.process_limit and len(data) >= self.process_limit:
+                break
+        else:
+            # Trailing blank rows are dropped, as read_excel does
+            del data[last_non_blank:]
+
+        return pd.DataFrame(data, columns=[header[index] for index in keep], dtype=TEXT_DTYPE)
+
+    @staticmethod
+    def _excel_cell_text(value) -> str:
+        """
+        Convert a raw cell value to text the way read_excel(dtype=str) does.
+        Whole-number floats lose their trailing .0, and calamine's midnight dates
+        are widened to the datetimes openpyxl returns for the same cells.
+
+        Args:
+            value: Raw cell value from calamine or openpyxl
+
+        Returns:
+            str: Cell value as text
+        """
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        if type(value) is date:
+            return str(datetime.combine(value, time()))
+        return str(value)
+
     def _identify_and_remove_missing_encounter_charge_efts(self):
         """
         Identify EFTs with 'Encounter not found.' or 'Charge not found.' description and remove all rows for those EFTs.
@@ -86,35 +338,38 @@ class ExcelDataObjectCreator:
         print("🔍 Checking for EFTs with missing encounters/charges...")
 
         # Find all EFT NUMs that have "Encounter not found." or "Charge not found." in Description
-        if 'Description' in self.df.columns:
+        if 'Description' in self._columns:
             missing_descriptions = ["Encounter not found.", "Charge not found."]
-            missing_mask = self.df['Description'].astype(str).str.strip().isin(missing_descriptions)
+            missing_mask = self.df['Description'].isin(missing_descriptions)
             missing_rows = self.df[missing_mask]
 
             if not missing_rows.empty:
                 # Get unique EFT NUMs that have missing encounters/charges
-                self.missing_encounter_efts = missing_rows['EFT NUM'].astype(str).unique().tolist()
-                self.missing_encounter_efts = [eft for eft in self.missing_encounter_efts if eft and eft.strip() != '']
+                self.missing_encounter_efts = missing_rows['EFT NUM'].unique().tolist()
+                self.missing_encounter_efts = [eft for eft in self.missing_encounter_efts if eft.strip()]
 
                 if self.missing_encounter_efts:
                     print(f"   ⚠️ Found {len(self.missing_encounter_efts)} EFTs with missing encounters/charges:")
 
                     # Show breakdown by description type
-                    encounter_not_found_efts = missing_rows[missing_rows['Description'].astype(str).str.strip() == "Encounter not found."]['EFT NUM'].astype(str).unique()
-                    charge_not_found_efts = missing_rows[missing_rows['Description'].astype(str).str.strip() == "Charge not found."]['EFT NUM'].astype(str).unique()
+                    encounter_not_found_efts = missing_rows[missing_rows['Description'] == "Encounter not found."]['EFT NUM'].unique()
+                    charge_not_found_efts = missing_rows[missing_rows['Description'] == "Charge not found."]['EFT NUM'].unique()
 
                     print(f"      • Encounter not found: {len(encounter_not_found_efts)} EFTs")
                     print(f"      • Charge not found: {len(charge_not_found_efts)} EFTs")
 
-                    for eft in self.missing_encounter_efts:
-                        # Determine which type of missing for this EFT
-                        eft_descriptions = missing_rows[missing_rows['EFT NUM'].astype(str) == eft]['Description'].astype(str).str.strip().unique()
-                        description_types = ", ".join(eft_descriptions)
-                        print(f"        • EFT: {eft} ({description_types})")
+                    if self.verbose:
+                        # Determine which type of missing for each EFT in a single grouping pass
+                        descriptions_by_eft = missing_rows.groupby('EFT NUM', sort=False)['Description'].unique()
+                        for eft in self.missing_encounter_efts:
+                            description_types = ", ".join(descriptions_by_eft[eft])
+                            print(f"        • EFT: {eft} ({description_types})")
 
                     # Remove ALL rows for these EFT NUMs from the dataframe
                     original_row_count = len(self.df)
-                    self.df = self.df[~self.df['EFT NUM'].astype(str).isin(self.missing_encounter_efts)].copy()
+                    # EFT NUM is matched as written, so a hashed membership test against a frozenset is enough
+                    missing_efts = frozenset(self.missing_encounter_efts)
+                    self.df = self.df.loc[~self.df['EFT NUM'].isin(missing_efts).to_numpy()]
                     removed_row_count = original_row_count - len(self.df)
 
                     print(f"   🗑️ Removed {removed_row_count:,} rows from {len(self.missing_encounter_efts)} EFTs with missing encounters/charges")
@@ -132,9 +387,9 @@ class ExcelDataObjectCreator:
         """
         print(f"🔍 Applying EFT filter for {len(self.eft_filter)} EFTs...")
         
-        if 'EFT NUM' in self.df.columns:
+        if 'EFT NUM' in self._columns:
             # Get current EFT numbers in the data
-            current_efts = set(self.df['EFT NUM'].astype(str).unique())
+            current_efts = set(self.df['EFT NUM'].unique())
             
             # Find which filter EFTs actually exist in the data
             existing_filter_efts = self.eft_filter.intersection(current_efts)
@@ -146,7 +401,7 @@ class ExcelDataObjectCreator:
             
             # Filter dataframe to only include rows for the specified EFTs
             original_row_count = len(self.df)
-            self.df = self.df[self.df['EFT NUM'].astype(str).isin(self.eft_filter)].copy()
+            self.df = self.df.loc[self.df['EFT NUM'].isin(self.eft_filter).to_numpy()]
             filtered_row_count = len(self.df)
             
             print(f"   📊 Filtered from {original_row_count:,} rows to {filtered_row_count:,} rows")
@@ -162,35 +417,86 @@ class ExcelDataObjectCreator:
         """
         print(f"🏗️ Creating data object for {self.payer_name}...")
 
-        # Get all unique EFT NUMs (after missing encounter/charge EFTs have been removed)
-        eft_nums = self.df['EFT NUM'].astype(str).unique()
-        eft_nums = [eft for eft in eft_nums if eft and eft.strip() != '']
+        # Bucket every row by EFT and payment in a single pass (after missing encounter/charge EFTs have been removed).
+        # The EFT frames are taken lazily, so only the EFT being built has its rows materialized
+        eft_index = self._get_eft_index()
+        eft_nums = list(eft_index)
+        eft_groups = (self.df.iloc[eft_index[eft_num][0]] for eft_num in eft_nums)
+        pmt_positions = (eft_index[eft_num][1] for eft_num in eft_nums)
 
         self.data_object = {}
 
-        for eft_num in eft_nums:
-            print(f"   📊 Processing EFT: {eft_num}")
+        if self.max_workers and self.max_workers > 1 and len(eft_nums) > 1:
+            # Each EFT is independent, so build them across worker processes;
+            # map() yields results in submission order, so the original EFT order is kept
+            chunksize = max(1, len(eft_nums) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                built_efts = executor.map(self._build_eft, eft_nums, eft_groups, pmt_positions, chunksize=chunksize)
+                self.data_object = dict(zip(eft_nums, built_efts))
+        else:
+            for eft_num, eft_rows, eft_pmt_positions in zip(eft_nums, eft_groups, pmt_positions):
+                self.data_object[eft_num] = self._build_eft(eft_num, eft_rows, eft_pmt_positions)
+
+        print(f"✅ Data object created with {len(self.data_object)} EFTs")
+        return self.data_object
+
+    def _get_eft_index(self) -> Dict[str, Tuple[List[int], Dict[Tuple[str, str], List[int]]]]:
+        """
+        Get the EFT/payment row index, building it on first use.
+        The rows do not change once loaded, so the index is shared by every later lookup.
 
-            # Get all rows for this EFT
-            eft_rows = self.get_eft_num_rows(eft_num)
+        Returns:
+            Dict[str, Tuple[List[int], Dict[Tuple[str, str], List[int]]]]: See _index_groups
+        """
+        if self._eft_index is None:
+            self._eft_index = self._index_groups()
+        return self._eft_index
 
-            # Create EFT object
-            eft_obj = self._create_eft_object(eft_num, eft_rows)
+    def _index_groups(self) -> Dict[str, Tuple[List[int], Dict[Tuple[str, str], List[int]]]]:
+        """
+        Bucket row positions by EFT NUM and by (PRACTICE ID, Chk Nbr) in one pass over the key columns.
+        Same grouping as groupby('EFT NUM') + get_pmt_num_rows, without building a frame per group.
 
-            # Get payment groups for this EFT
-            pmt_groups = self.get_pmt_num_rows(eft_rows)
+        Returns:
+            Dict[str, Tuple[List[int], Dict[Tuple[str, str], List[int]]]]: For each non-blank EFT NUM, its row
+            positions in self.df and its payment row positions within those rows, both in order of first appearance
+        """
+        eft_index = {}
+        key_columns = zip(self.df['EFT NUM'].to_numpy(), self.df['PRACTICE ID'].to_numpy(), self.df['Chk Nbr'].to_numpy())
 
-            # Create payment objects
-            payments = {}
-            for pmt_key, pmt_rows in pmt_groups.items():
-                payment_obj = self._create_payment_object(pmt_key, pmt_rows)
-                payments[pmt_key] = payment_obj
+        for position, (eft_num, practice_id, chk_nbr) in enumerate(key_columns):
+            if not eft_num.strip():
+                continue
+            eft_positions, pmt_positions = eft_index.setdefault(eft_num, ([], {}))
+            if practice_id or chk_nbr:  # Skip empty combinations
+                pmt_positions.setdefault((practice_id, chk_nbr), []).append(len(eft_positions))
+            eft_positions.append(position)
 
-            eft_obj["payments"] = payments
-            self.data_object[eft_num] = eft_obj
+        return eft_index
 
-        print(f"✅ Data object created with {len(self.data_object)} EFTs")
-        return self.data_object
+    def _build_eft(self, eft_num: str, eft_rows: pd.DataFrame, pmt_positions: Dict[Tuple[str, str], List[int]]) -> Dict:
+        """
+        Build the complete EFT object (with payments, encounters, and services) for one EFT.
+
+        Args:
+            eft_num (str): EFT number
+            eft_rows (pd.DataFrame): All rows for this EFT
+            pmt_positions (Dict[Tuple[str, str], List[int]]): Row positions within eft_rows for each (practice_id, chk_nbr)
+
+        Returns:
+            Dict: EFT object with nested payment objects
+        """
+        if self.verbose:
+            print(f"   📊 Processing EFT: {eft_num}")
+
+        # Build the payment objects from the row positions bucketed for this EFT
+        payments = {
+            pmt_key: self._create_payment_object(pmt_key, eft_rows.iloc[positions])
+            for pmt_key, positions in pmt_positions.items()
+        }
+
+        # Create EFT object with its payments already built
+        return self._create_eft_object(eft_num, eft_rows, payments)
 
     def get_eft_num_rows(self, eft_num: str) -> pd.DataFrame:
         """
@@ -202,9 +508,15 @@ class ExcelDataObjectCreator:
         Returns:
             pd.DataFrame: Filtered dataframe with matching EFT NUM
         """
-        return self.df[self.df['EFT NUM'].astype(str) == str(eft_num)].copy()
+        eft_num = str(eft_num)
+        eft_index = self._get_eft_index()
+        if eft_num in eft_index:
+            return self.df.iloc[eft_index[eft_num][0]]
 
-    def get_pmt_num_rows(self, eft_rows: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        # Blank and unknown EFT NUMs are not indexed
+        return self.df[self.df['EFT NUM'] == eft_num]
+
+    def get_pmt_num_rows(self, eft_rows: pd.DataFrame) -> Dict[Tuple[str, str], pd.DataFrame]:
         """
         Get groups of rows for each PMT NUM (PRACTICE_ID + Chk Nbr combination).
 
@@ -212,19 +524,16 @@ class ExcelDataObjectCreator:
             eft_rows (pd.DataFrame): Rows filtered by EFT NUM
 
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary with pmt_num as key and filtered rows as value
+            Dict[Tuple[str, str], pd.DataFrame]: Dictionary with (practice_id, chk_nbr) as key and filtered rows as value
         """
-        pmt_groups = {}
-
-        # Create PMT NUM by combining PRACTICE_ID and Chk Nbr
-        eft_rows['pmt_num'] = eft_rows['PRACTICE ID'].astype(str) + '_' + eft_rows['Chk Nbr'].astype(str)
+        pmt_positions = {}
 
-        # Group by unique PMT NUM combinations
-        for pmt_num in eft_rows['pmt_num'].unique():
-            if pmt_num and pmt_num != '_':  # Skip empty combinations
-                pmt_groups[pmt_num] = eft_rows[eft_rows['pmt_num'] == pmt_num].copy()
+        # Bucket row positions by (PRACTICE_ID, Chk Nbr) in a single pass, in order of first appearance
+        for position, pmt_key in enumerate(zip(eft_rows['PRACTICE ID'].to_numpy(), eft_rows['Chk Nbr'].to_numpy())):
+            if pmt_key[0] or pmt_key[1]:  # Skip empty combinations
+                pmt_positions.setdefault(pmt_key, []).append(position)
 
-        return pmt_groups
+        return {pmt_key: eft_rows.iloc[positions] for pmt_key, positions in pmt_positions.items()}
 
     def get_pla_rows(self, pmt_rows: pd.DataFrame) -> pd.DataFrame:
         """
@@ -238,51 +547,106 @@ class ExcelDataObjectCreator:
         Returns:
             pd.DataFrame: Filtered dataframe with PLA rows
         """
-        if 'Description' not in pmt_rows.columns:
+        if 'Description' not in self._columns:
             return pd.DataFrame()
 
+        row_kinds = self._get_row_kinds(pmt_rows)
+        return pmt_rows[(row_kinds & ROW_PLA).astype(bool)]
+
+    def _get_row_kinds(self, pmt_rows: pd.DataFrame) -> np.ndarray:
+        """
+        Get the row kind bits (ROW_PLA, ROW_L6, ROW_ENCOUNTER, ROW_SERVICE) for a payment.
+        Slices the kinds classified once at load time; worker processes, which do not
+        receive them, classify the payment rows directly.
+
+        Args:
+            pmt_rows (pd.DataFrame): Rows filtered by PMT NUM
+
+        Returns:
+            np.ndarray: Row kind bits aligned with pmt_rows
+        """
+        if self._row_kinds is None:
+            return self._compute_row_kinds(pmt_rows)
+
+        return self._row_kinds[pmt_rows.index.to_numpy()]
+
+    @staticmethod
+    def _compute_row_kinds(rows: pd.DataFrame) -> np.ndarray:
+        """
+        Classify every row as PLA, L6 PLA, encounter and/or service in one vectorized pass.
+        The two PLA criteria are mutually exclusive on Enc Nbr, so the L6 bit is condition 2 itself.
+
+        Args:
+            rows (pd.DataFrame): Rows to classify
+
+        Returns:
+            np.ndarray: uint8 row kind bits aligned with rows
+        """
+        row_kinds = np.zeros(len(rows), dtype=np.uint8)
+        if 'Enc Nbr' not in rows.columns:
+            return row_kinds
+
+        # Enc Nbr stays raw for grouping, so it is stripped for the blank test; the match columns are
+        # stripped at load, so every other test is a single comparison or a plain substring test
+        enc_blank = (rows['Enc Nbr'].str.strip() == '').to_numpy()
+        row_kinds[~enc_blank] |= ROW_ENCOUNTER
+        if 'CPT4' in rows.columns:
+            row_kinds[~enc_blank & (rows['CPT4'] != '').to_numpy()] |= ROW_SERVICE
+
+        if 'Description' not in rows.columns:
+            return row_kinds
+        descriptions = rows['Description'].to_numpy()
+
         # Condition 1: Enc Nbr = "" AND Description contains "Provider Level Adjustment"
-        condition1 = (
-            (pmt_rows['Enc Nbr'].astype(str).str.strip() == '') &
-            (pmt_rows['Description'].astype(str).str.contains('Provider Level Adjustment', na=False))
+        condition1 = enc_blank & np.fromiter(
+            ('Provider Level Adjustment' in description for description in descriptions), dtype=bool, count=len(descriptions)
         )
 
         # Condition 2: Clm Nbr = "Provider Lvl Adj" AND Enc Nbr != "" AND Description contains "L6"
-        condition2 = (
-            (pmt_rows.get('Clm Nbr', pd.Series(dtype=str)).astype(str).str.strip() == 'Provider Lvl Adj') &
-            (pmt_rows['Enc Nbr'].astype(str).str.strip() != '') &
-            (pmt_rows['Description'].astype(str).str.contains('L6', na=False))
-        )
+        if 'Clm Nbr' in rows.columns:
+            condition2 = (
+                (rows['Clm Nbr'] == 'Provider Lvl Adj').to_numpy() &
+                ~enc_blank &
+                np.fromiter(('L6' in description for description in descriptions), dtype=bool, count=len(descriptions))
+            )
+        else:
+            condition2 = np.zeros(len(rows), dtype=bool)
 
         # Combine conditions with OR
-        pla_mask = condition1 | condition2
-        return pmt_rows[pla_mask].copy()
+        row_kinds[condition1 | condition2] |= ROW_PLA
+        row_kinds[condition2] |= ROW_L6
+        return row_kinds
 
-    def get_encounter_rows(self, pmt_rows: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    def get_encounter_rows(self, pmt_rows: pd.DataFrame) -> Dict[Tuple[str, str], pd.DataFrame]:
         """
         Get encounter rows grouped by Enc Nbr where Enc Nbr is not blank and Clm Sts is the same.
 
+        The claim status in each key is the raw Clm Sts Cod, so statuses that differ only in
+        parenthetical text or whitespace stay separate encounters.
+
         Args:
             pmt_rows (pd.DataFrame): Rows filtered by PMT NUM
 
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary with enc_num as key and filtered rows as value
+            Dict[Tuple[str, str], pd.DataFrame]: Dictionary with (enc_nbr, clm_sts) as key and filtered rows as value
         """
         encounter_groups = {}
 
-        if 'Enc Nbr' not in pmt_rows.columns:
+        if 'Enc Nbr' not in self._columns:
             return encounter_groups
 
-        # Filter rows where Enc Nbr is not blank
-        enc_rows = pmt_rows[pmt_rows['Enc Nbr'].astype(str).str.strip() != ''].copy()
+        # Filter rows where Enc Nbr is not blank, using the row kinds classified at load
+        enc_rows = pmt_rows[(self._get_row_kinds(pmt_rows) & ROW_ENCOUNTER).astype(bool)]
 
-        # Group by Enc Nbr and Clm Sts Cod combination
-        if not enc_rows.empty and 'Clm Sts Cod' in enc_rows.columns:
-            enc_rows['enc_key'] = enc_rows['Enc Nbr'].astype(str) + '_' + enc_rows['Clm Sts Cod'].astype(str)
+        # Bucket row positions by Enc Nbr and raw Clm Sts Cod combination, in order of first appearance
+        if not enc_rows.empty and 'Clm Sts Cod' in self._columns:
+            enc_positions = {}
+            enc_keys = zip(enc_rows['Enc Nbr'].to_numpy(), enc_rows['Clm Sts Cod'].to_numpy())
+            for position, enc_key in enumerate(enc_keys):
+                enc_positions.setdefault(enc_key, []).append(position)
 
-            for enc_key in enc_rows['enc_key'].unique():
-                if enc_key and enc_key != '_':
-                    encounter_groups[enc_key] = enc_rows[enc_rows['enc_key'] == enc_key].copy()
+            for enc_key, positions in enc_positions.items():
+                encounter_groups[enc_key] = enc_rows.iloc[positions]
 
         return encounter_groups
 
@@ -296,48 +660,49 @@ class ExcelDataObjectCreator:
         Returns:
             pd.DataFrame: Filtered dataframe with service rows
         """
-        if 'CPT4' not in enc_rows.columns:
+        if 'CPT4' not in self._columns:
             return pd.DataFrame()
 
-        service_mask = enc_rows['CPT4'].astype(str).str.strip() != ''
-        return enc_rows[service_mask].copy()
+        service_mask = enc_rows['CPT4'] != ''
+        return enc_rows[service_mask]
 
-    def _create_eft_object(self, eft_num: str, eft_rows: pd.DataFrame) -> Dict:
+    def _create_eft_object(self, eft_num: str, eft_rows: pd.DataFrame, payments: Dict) -> Dict:
         """
         Create EFT object from the rows.
 
         Args:
             eft_num (str): EFT number
             eft_rows (pd.DataFrame): All rows for this EFT
+            payments (Dict): Payment objects for this EFT keyed by (practice_id, chk_nbr)
 
         Returns:
             Dict: EFT object with all attributes
         """
         # Get payer from PAYER FOLDER column if available, otherwise use payer_name
         payer = self.payer_name
-        if 'PAYER FOLDER' in eft_rows.columns:
-            payer_values = eft_rows['PAYER FOLDER'].astype(str).unique()
-            payer_values = [p for p in payer_values if p and p.strip() != '']
-            if payer_values:
-                payer = payer_values[0]  # Use first non-empty payer folder value
+        if 'PAYER FOLDER' in self._columns:
+            # Use first non-empty payer folder value
+            first_payer = next((p for p in eft_rows['PAYER FOLDER'].unique() if p.strip()), None)
+            if first_payer is not None:
+                payer = first_payer
 
         # Build EFT object
         eft = {
-            "eft_num": str(eft_num),
-            "payer": str(payer),
+            "eft_num": eft_num,
+            "payer": sys.intern(payer),
             "is_split": False,  # Will be set by PaymentTagger
             "status": "",  # Will be set by PaymentTagger
-            "payments": {}  # Will be populated with payment objects
+            "payments": payments
         }
 
         return eft
 
-    def _create_payment_object(self, payment_key: str, pmt_rows: pd.DataFrame) -> Dict:
+    def _create_payment_object(self, payment_key: Tuple[str, str], pmt_rows: pd.DataFrame) -> Dict:
         """
         Create payment object from the rows by parsing the File column.
 
         Args:
-            payment_key (str): Payment key (practice_id_check_number) - used for grouping but actual values come from File column
+            payment_key (Tuple[str, str]): Payment key (practice_id, check_number) - used for grouping but actual values come from File column
             pmt_rows (pd.DataFrame): All rows for this payment
 
         Returns:
@@ -346,20 +711,22 @@ class ExcelDataObjectCreator:
         # Parse the File column to get the authoritative payment information
         practice_id, pmt_num, payment_amount, file_date = self._parse_file_column(pmt_rows)
 
-        # Get PLA rows for this payment
-        pla_rows = self.get_pla_rows(pmt_rows)
-        plas = self._create_pla_objects(pla_rows)
+        # Row kinds are classified once and shared by the PLA and encounter passes below
+        row_kinds = self._get_row_kinds(pmt_rows)
+
+        # Get PLA descriptions and L6 flags for this payment
+        pla_descriptions, pla_is_l6 = self._split_pla_rows(pmt_rows, row_kinds)
+        plas = self._create_pla_objects(pla_descriptions, pla_is_l6)
 
         # Calculate PLA amounts
-        pla_amounts = self._calculate_pla_amounts(pla_rows)
+        pla_amounts = self._calculate_pla_amounts(pla_descriptions, pla_is_l6)
 
         # Get encounter groups for this payment
-        enc_groups = self.get_encounter_rows(pmt_rows)
-        encounters = {}
-
-        for enc_key, enc_rows in enc_groups.items():
-            encounter_obj = self._create_encounter_object(enc_key, enc_rows)
-            encounters[enc_key] = encounter_obj
+        enc_services = self._group_encounter_services(pmt_rows, row_kinds)
+        encounters = {
+            enc_key: self._create_encounter_object(enc_key, services)
+            for enc_key, services in enc_services.items()
+        }
 
         # Calculate encounter counts
         total_encounters = len(encounters)
@@ -370,10 +737,10 @@ class ExcelDataObjectCreator:
 
         # Build payment object
         payment = {
-            "practice_id": str(practice_id),
-            "num": str(pmt_num),
+            "practice_id": practice_id,
+            "num": pmt_num,
             "amt": payment_amount,
-            "file_date": str(file_date),  # File date extracted from File column
+            "file_date": file_date,  # File date extracted from File column
             "status": "",  # Will be set by PaymentTagger
             "plas": plas,
             "pla_l6_amts": pla_amounts["pla_l6_amts"],  # Sum of L6 PLA amounts
@@ -399,20 +766,17 @@ class ExcelDataObjectCreator:
         Returns:
             tuple[str, str, float, str]: (practice_id, payment_number, payment_amount, file_date)
         """
-        if 'File' not in pmt_rows.columns:
+        if 'File' not in self._columns:
             print(f"   ⚠️ Warning: No 'File' column found in payment rows")
             return "", "", 0.0, ""
 
         # Get the first non-empty file name (should be the same for all rows in this payment)
-        file_names = pmt_rows['File'].astype(str).str.strip()
-        file_names = file_names[file_names != '']  # Remove empty values
+        file_name = next(filter(None, map(str.strip, pmt_rows['File'])), '')
 
-        if len(file_names) == 0:
+        if not file_name:
             print(f"   ⚠️ Warning: No file names found in payment rows")
             return "", "", 0.0, ""
 
-        file_name = file_names.iloc[0]
-
         try:
             # Split by underscore: {WS_ID}_{WAYSTAR ID}_{AMT}_{CHK NBR}_{TYPE}_{FILE_DATE}
             parts = file_name.split('_')
@@ -421,13 +785,9 @@ class ExcelDataObjectCreator:
                 print(f"   ⚠️ Warning: File name format unexpected - expected 6 parts, got {len(parts)}: {file_name}")
                 return "", "", 0.0, ""
 
-            # Extract the components
-            ws_id = parts[0].strip()              # WS_ID (practice identifier)
-            waystar_id = parts[1].strip()         # WAYSTAR ID
-            amount_str = parts[2].strip()         # AMT (payment amount)
-            chk_nbr = parts[3].strip()            # CHK NBR (payment/check number)
-            payment_type = parts[4].strip()       # TYPE (ACH, etc.)
-            file_date = parts[5].strip()          # FILE_DATE
+            # Extract the components: WS_ID (practice identifier), WAYSTAR ID, AMT (payment amount),
+            # CHK NBR (payment/check number), TYPE (ACH, etc.), FILE_DATE
+            ws_id, waystar_id, amount_str, chk_nbr, payment_type, file_date = map(str.strip, parts[:6])
 
             # Convert amount to float
             payment_amount = float(amount_str)
@@ -436,11 +796,12 @@ class ExcelDataObjectCreator:
             practice_id = ws_id
             pmt_num = chk_nbr
 
-            print(f"   📄 Parsed file: {file_name}")
-            print(f"      • Practice ID: {practice_id}")
-            print(f"      • Payment Num: {pmt_num}")
-            print(f"      • Amount: ${payment_amount:,.2f}")
-            print(f"      • File Date: {file_date}")
+            if self.verbose:
+                print(f"   📄 Parsed file: {file_name}")
+                print(f"      • Practice ID: {practice_id}")
+                print(f"      • Payment Num: {pmt_num}")
+                print(f"      • Amount: ${payment_amount:,.2f}")
+                print(f"      • File Date: {file_date}")
 
             return practice_id, pmt_num, payment_amount, file_date
 
@@ -448,49 +809,46 @@ class ExcelDataObjectCreator:
             print(f"   ❌ Error parsing file name '{file_name}': {e}")
             return "", "", 0.0, ""
 
-    def _calculate_pla_amounts(self, pla_rows: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_pla_amounts(self, descriptions: List[str], is_l6: List[bool]) -> Dict[str, float]:
         """
         Calculate PLA amounts from PLA rows using the actual amounts (no reverse logic).
 
         Args:
-            pla_rows (pd.DataFrame): PLA rows
+            descriptions (List[str]): PLA row descriptions
+            is_l6 (List[bool]): L6 flag for each description
 
         Returns:
             Dict[str, float]: Dictionary with pla_l6_amts and pla_other_amts
         """
-        pla_l6_amts = 0.0
-        pla_other_amts = 0.0
+        # Extract amounts once; rows without a parseable amount are skipped (actual amounts, no reverse logic)
+        amounts = self._extract_pla_amounts(descriptions)
 
-        if 'Description' not in pla_rows.columns:
-            return {"pla_l6_amts": pla_l6_amts, "pla_other_amts": pla_other_amts}
+        pla_l6_amts = sum(amt for amt, l6 in zip(amounts, is_l6) if amt is not None and l6)
+        pla_other_amts = sum(amt for amt, l6 in zip(amounts, is_l6) if amt is not None and not l6)
 
-        for _, row in pla_rows.iterrows():
-            description = str(row['Description']).strip()
-            clm_nbr = str(row.get('Clm Nbr', '')).strip()
-            enc_nbr = str(row.get('Enc Nbr', '')).strip()
+        return {"pla_l6_amts": float(pla_l6_amts), "pla_other_amts": float(pla_other_amts)}
 
-            # Extract amount from description
-            pla_amount = self._extract_pla_amount(description)
+    def _split_pla_rows(self, pmt_rows: pd.DataFrame, row_kinds: np.ndarray) -> Tuple[List[str], List[bool]]:
+        """
+        Pull the PLA descriptions of a payment together with their L6 flags.
 
-            if pla_amount is not None:
-                # Use actual PLA amount (no reverse logic)
-                actual_amount = pla_amount
+        L6 PLAs are identified by condition 2 from the PLA criteria:
+        Clm Nbr = "Provider Lvl Adj" AND Enc Nbr != "" AND Description contains "L6"
 
-                # Determine if this is L6 or other PLA
-                # L6 PLAs are identified by condition 2 from the PLA criteria:
-                # Clm Nbr = "Provider Lvl Adj" AND Enc Nbr != "" AND Description contains "L6"
-                is_l6 = (
-                    clm_nbr == "Provider Lvl Adj" and
-                    enc_nbr != "" and
-                    'L6' in description
-                )
+        Args:
+            pmt_rows (pd.DataFrame): Rows filtered by PMT NUM
+            row_kinds (np.ndarray): Row kind bits aligned with pmt_rows
 
-                if is_l6:
-                    pla_l6_amts += actual_amount
-                else:
-                    pla_other_amts += actual_amount
+        Returns:
+            Tuple[List[str], List[bool]]: PLA descriptions and matching L6 flags, in row order
+        """
+        if 'Description' not in self._columns:
+            return [], []
 
-        return {"pla_l6_amts": pla_l6_amts, "pla_other_amts": pla_other_amts}
+        pla_mask = (row_kinds & ROW_PLA).astype(bool)
+        descriptions = pmt_rows['Description'].to_numpy()[pla_mask]
+
+        return descriptions.tolist(), (row_kinds[pla_mask] & ROW_L6).astype(bool).tolist()
 
     def _extract_pla_amount(self, description: str) -> Optional[float]:
         """
@@ -502,59 +860,49 @@ class ExcelDataObjectCreator:
         Returns:
             Optional[float]: Extracted amount or None if not found
         """
-        # Look for dollar amounts in the description
-        # Common patterns: $123.45, $-123.45, -$123.45, etc.
+        # Look for dollar amounts first, then labelled numbers like "found: 123.45",
+        # then any decimal number - a single match call tries them in that order
+        return self._pla_amount_from_match(PLA_AMOUNT_PATTERN.match(description))
 
-        # First try to find patterns with $ sign
-        dollar_patterns = [
-            r'\$(-?\d+\.?\d*)',  # $123.45 or $-123.45
-            r'(-?\$\d+\.?\d*)',  # -$123.45
-            r'Amt:\s*\$?(-?\d+\.?\d*)',  # Amt: $123.45 or Amt: 123.45
-            r'Amount:\s*\$?(-?\d+\.?\d*)',  # Amount: $123.45 or Amount: 123.45
-        ]
+    def _extract_pla_amounts(self, descriptions: List[str]) -> List[Optional[float]]:
+        """
+        Extract PLA amounts for a whole batch of descriptions in one pass.
 
-        for pattern in dollar_patterns:
-            matches = re.findall(pattern, description)
-            if matches:
-                try:
-                    # Get the first match and clean it
-                    amount_str = matches[0].replace('$', '').strip()
-                    return float(amount_str)
-                except (ValueError, TypeError):
-                    continue
-
-        # If no dollar patterns found, look for any number that might be an amount
-        # Look for patterns like "Provider Level Adjustment found: 123.45"
-        number_patterns = [
-            r'found:\s*(-?\d+\.?\d*)',  # found: 123.45
-            r'applied:\s*(-?\d+\.?\d*)',  # applied: 123.45
-            r':\s*(-?\d+\.?\d*)$',  # ends with : 123.45
-        ]
+        Args:
+            descriptions (List[str]): PLA description texts
 
-        for pattern in number_patterns:
-            matches = re.findall(pattern, description)
-            if matches:
-                try:
-                    return float(matches[0])
-                except (ValueError, TypeError):
-                    continue
-
-        # Last resort: look for any decimal number in the description
-        decimal_matches = re.findall(r'(-?\d+\.\d{2})', description)
-        if decimal_matches:
-            try:
-                return float(decimal_matches[0])
-            except (ValueError, TypeError):
-                pass
+        Returns:
+            List[Optional[float]]: Extracted amount (or None) for each description, in order
+        """
+        return [self._pla_amount_from_match(match) for match in map(PLA_AMOUNT_PATTERN.match, descriptions)]
 
-        return None
+    @staticmethod
+    def _pla_amount_from_match(match: Optional[re.Match]) -> Optional[float]:
+        """
+        Convert a PLA_AMOUNT_PATTERN match into the amount it captured.
+
+        Args:
+            match (Optional[re.Match]): Match result, or None when nothing matched
+
+        Returns:
+            Optional[float]: Extracted amount or None if not found
+        """
+        if not match:
+            return None
+
+        # Only the winning branch's groups are set; the -$ branch splits the sign from the digits
+        if match.lastgroup == 'neg_dollar_amt':
+            return float(match.group('neg_dollar') + match.group('neg_dollar_amt'))
+
+        return float(match.group(match.lastgroup))
 
-    def _create_pla_objects(self, pla_rows: pd.DataFrame) -> Dict[str, List]:
+    def _create_pla_objects(self, descriptions: List[str], is_l6: List[bool]) -> Dict[str, List]:
         """
         Create PLA objects from PLA rows.
 
         Args:
-            pla_rows (pd.DataFrame): PLA rows
+            descriptions (List[str]): PLA row descriptions
+            is_l6 (List[bool]): L6 flag for each description
 
         Returns:
             Dict[str, List]: PLA objects with L6 and other categories
@@ -562,27 +910,9 @@ class ExcelDataObjectCreator:
         pla_l6 = []
         pla_other = []
 
-        if 'Description' in pla_rows.columns:
-            for _, row in pla_rows.iterrows():
-                description = str(row['Description']).strip()
-                clm_nbr = str(row.get('Clm Nbr', '')).strip()
-                enc_nbr = str(row.get('Enc Nbr', '')).strip()
-
-                # Clean description - remove "Provider Level Adjustment found: " prefix
-                clean_description = self._clean_pla_description(description)
-
-                # L6 PLAs are identified by condition 2 from the PLA criteria:
-                # Clm Nbr = "Provider Lvl Adj" AND Enc Nbr != "" AND Description contains "L6"
-                is_l6 = (
-                    clm_nbr == "Provider Lvl Adj" and
-                    enc_nbr != "" and
-                    'L6' in description
-                )
-
-                if is_l6:
-                    pla_l6.append(clean_description)
-                else:
-                    pla_other.append(clean_description)
+        # Clean description - remove "Provider Level Adjustment found: " prefix
+        for description, l6 in zip(descriptions, is_l6):
+            (pla_l6 if l6 else pla_other).append(self._clean_pla_description(description))
 
         return {
             "pla_l6": pla_l6,
@@ -600,124 +930,146 @@ class ExcelDataObjectCreator:
             str: Cleaned description with prefix removed
         """
         # Remove "Provider Level Adjustment found: " prefix if present
-        if "Provider Level Adjustment found: " in description:
-            return description.replace("Provider Level Adjustment found: ", "").strip()
+        # Common case: the prefix leads the description once, so a slice avoids the replace scan
+        if description.startswith(PLA_FOUND_PREFIX):
+            remaining = description[len(PLA_FOUND_PREFIX):]
+            if PLA_FOUND_PREFIX not in remaining:
+                return remaining.strip()
+
+        if PLA_FOUND_PREFIX in description:
+            return description.replace(PLA_FOUND_PREFIX, "").strip()
 
         # Also handle other potential prefixes
-        if "Provider Level Adjustment " in description:
-            # Find the part after "Provider Level Adjustment" and any following text until we hit the actual data
-            parts = description.split("Provider Level Adjustment")
-            if len(parts) > 1:
-                # Look for the actual amount/data part (usually starts with $ or other data)
-                remaining = parts[1].strip()
-                # Remove common prefixes like "found: ", "applied: ", etc.
-                for prefix in ["found: ", "applied: ", ": ", " - "]:
-                    if remaining.startswith(prefix):
-                        remaining = remaining[len(prefix):].strip()
-                        break
-                return remaining
+        start = description.find(PLA_LABEL)
+        if start >= 0 and description.find(PLA_LABEL + " ", start) >= 0:
+            # Take the part after "Provider Level Adjustment" up to any repeat of the label
+            remaining = description[start + len(PLA_LABEL):]
+            end = remaining.find(PLA_LABEL)
+            if end >= 0:
+                remaining = remaining[:end]
+            remaining = remaining.strip()
+            # Remove common prefixes like "found: ", "applied: ", etc.
+            for prefix in ["found: ", "applied: ", ": ", " - "]:
+                if remaining.startswith(prefix):
+                    remaining = remaining[len(prefix):].strip()
+                    break
+            return remaining
 
         # If no known prefix, return original description
         return description
 
-    def _create_encounter_object(self, encounter_key: str, enc_rows: pd.DataFrame) -> Dict:
+    def _group_encounter_services(self, pmt_rows: pd.DataFrame, row_kinds: np.ndarray) -> Dict[Tuple[str, str], List[Service]]:
         """
-        Create encounter object from the rows.
+        Build every service of a payment in one columnar pass and bucket them by encounter.
+        Same grouping as get_encounter_rows + get_service_rows, without per-encounter frames.
 
         Args:
-            encounter_key (str): Encounter key (enc_nbr_clm_sts)
-            enc_rows (pd.DataFrame): All rows for this encounter
+            pmt_rows (pd.DataFrame): Rows filtered by PMT NUM
+            row_kinds (np.ndarray): Row kind bits aligned with pmt_rows
 
         Returns:
-            Dict: Encounter object with all attributes
+            Dict[Tuple[str, str], List[Service]]: Services keyed by (enc_nbr, raw clm_sts), encounters in order of first appearance
         """
-        # Parse encounter key
-        if '_' in encounter_key:
-            enc_nbr, clm_sts = encounter_key.split('_', 1)
-        else:
-            enc_nbr = encounter_key
-            clm_sts = ""
+        if 'Enc Nbr' not in self._columns or 'Clm Sts Cod' not in self._columns:
+            return {}
+
+        # Encounter rows are those with a non-blank Enc Nbr
+        enc_mask = (row_kinds & ROW_ENCOUNTER).astype(bool)
+        enc_rows = pmt_rows[enc_mask]
+        enc_keys = list(zip(enc_rows['Enc Nbr'].to_numpy(), enc_rows['Clm Sts Cod'].to_numpy()))
 
-        # Clean claim status - remove parenthetical text
-        if '(' in clm_sts:
-            clm_sts = clm_sts.split('(')[0].strip()
+        # Every encounter gets a bucket, even when none of its rows are services
+        enc_services = {enc_key: [] for enc_key in enc_keys}
 
-        # Get service rows for this encounter
-        service_rows = self.get_service_rows(enc_rows)
-        services = self._create_service_objects(service_rows)
+        service_mask = (row_kinds[enc_mask] & ROW_SERVICE).astype(bool)
+        if service_mask.any():
+            services = self._create_service_objects(enc_rows[service_mask])
+            for enc_key, service in zip(compress(enc_keys, service_mask), services):
+                enc_services[enc_key].append(service)
+
+        return enc_services
+
+    def _create_encounter_object(self, encounter_key: Tuple[str, str], services: List[Service]) -> Dict:
+        """
+        Create encounter object from its services.
+
+        Args:
+            encounter_key (Tuple[str, str]): Encounter key (enc_nbr, clm_sts) with the raw claim status
+            services (List[Service]): Service objects for this encounter, in row order
+
+        Returns:
+            Dict: Encounter object with all attributes
+        """
+        enc_nbr, clm_sts = encounter_key
 
         # Build encounter object
         encounter = {
-            "num": str(enc_nbr),
-            "status": str(clm_sts),
+            "num": enc_nbr,
+            "status": _encounter_claim_status(clm_sts),
             "services": services,
             "tags": []  # Will be populated by EncounterTagger
         }
 
         return encounter
 
-    def _create_service_objects(self, service_rows: pd.DataFrame) -> List[Dict]:
+    @staticmethod
+    def _clean_claim_status(clm_sts: pd.Series) -> pd.Series:
         """
-        Create service objects from service rows.
+        Clean claim statuses by removing parenthetical text (e.g. "1 (Processed as Primary)" -> "1").
+        Uses one str.partition per value rather than chained .str split/index/strip passes;
+        categorical input is cleaned once per category and expanded through the codes.
 
         Args:
-            service_rows (pd.DataFrame): Service rows (rows with CPT4 codes)
+            clm_sts (pd.Series): Raw Clm Sts Cod values
 
         Returns:
-            List[Dict]: List of service objects
+            pd.Series: Claim status codes without parenthetical text
         """
-        services = []
+        if isinstance(clm_sts.dtype, pd.CategoricalDtype):
+            cleaned = np.array([value.partition('(')[0].strip() for value in clm_sts.cat.categories], dtype=object)
+            return pd.Series(cleaned[clm_sts.cat.codes.to_numpy()], index=clm_sts.index, dtype=str)
+        return pd.Series([value.partition('(')[0].strip() for value in clm_sts], index=clm_sts.index, dtype=str)
 
-        for _, row in service_rows.iterrows():
-            service = self._create_service_object(row)
-            services.append(service)
-
-        return services
-
-    def _create_service_object(self, row: pd.Series) -> Dict:
+    def _create_service_objects(self, service_rows: pd.DataFrame) -> List[Service]:
         """
-        Create individual service object from a single row.
+        Create service objects from service rows.
+        Columns are already stripped at load, so every Service is built straight from the zipped columns.
 
         Args:
-            row (pd.Series): Single row of service data
+            service_rows (pd.DataFrame): Service rows (rows with CPT4 codes)
 
         Returns:
-            Dict: Service object with all attributes
-        """
-        # Extract reason codes
-        reason_codes = []
-        if 'Reason Cd' in row.index:
-            reason_cd = str(row['Reason Cd']).strip()
-            if reason_cd:
-                reason_codes = [reason_cd]
-
-        # Extract remark codes
-        remark_codes = []
-        if 'Remark Codes' in row.index:
-            remark_cd = str(row['Remark Codes']).strip()
-            if remark_cd:
-                remark_codes = [remark_cd]
-
-        # Clean claim status - remove parenthetical text
-        clm_sts = str(row.get('Clm Sts Cod', '')).strip()
-        if '(' in clm_sts:
-            clm_sts = clm_sts.split('(')[0].strip()
-
-        # Build service object - all values as strings to preserve Excel TEXT formatting
-        service = {
-            "clm_sts": clm_sts,
-            "posting_sts": str(row.get('Posting Sts', '')).strip(),
-            "cpt4": str(row.get('CPT4', '')).strip(),
-            "txn_status": str(row.get('Txn Status', '')).strip(),
-            "description": str(row.get('Description', '')).strip(),
-            "bill_amt": str(row.get('Bill Amt', '')).strip(),
-            "paid_amt": str(row.get('Pd Amt', '')).strip(),
-            "ded_amt": str(row.get('Ded Amt', '')).strip(),
-            "codes": reason_codes,
-            "remarks": remark_codes
-        }
-
-        return service
+            List[Service]: List of service objects
+        """
+        # Clean claim statuses for all service rows at once
+        if 'Clm Sts Cod' in self._columns:
+            clm_stses = self._clean_claim_status(service_rows['Clm Sts Cod'])
+        else:
+            clm_stses = [''] * len(service_rows)
+
+        # Pull every source column out as a plain list (missing columns become '')
+        service_values = service_rows.reindex(columns=SERVICE_COLUMNS, fill_value='')
+        (posting_stses, cpt4s, txn_statuses, descriptions, bill_amts,
+         paid_amts, ded_amts, reason_cds, remark_cds) = (service_values[col].tolist() for col in SERVICE_COLUMNS)
+
+        # Reason and remark codes are single-code tuples, or empty when blank
+        reason_codes = [(code,) if code else () for code in reason_cds]
+        remark_codes = [(code,) if code else () for code in remark_cds]
+
+        # Build services - all values as strings to preserve Excel TEXT formatting
+        # Short-vocabulary fields are interned so repeated values share one string object
+        return list(map(Service._make, zip(
+            map(sys.intern, clm_stses),
+            map(sys.intern, posting_stses),
+            map(sys.intern, cpt4s),
+            map(sys.intern, txn_statuses),
+            descriptions,
+            bill_amts,
+            paid_amts,
+            ded_amts,
+            reason_codes,
+            remark_codes
+        )))
 
     def get_data_object(self) -> Dict:
         """
@@ -776,7 +1128,10 @@ class ExcelDataObjectCreator:
         
         # Collect stats data
         stats_data = []
-        
+
+        # Description flags for every payment, from one pass over the rows instead of two scans per payment
+        description_flags = self._get_payment_description_flags()
+
         for eft_num, eft in self.data_object.items():
             for payment_key, payment in eft["payments"].items():
                 # Calculate PLA count
@@ -787,8 +1142,9 @@ class ExcelDataObjectCreator:
                 total_encounters = len(payment.get("encounters", {}))
                 
                 # Check for COB Balance and CHG/ENC NOT FOUND conditions
-                cob_balance = self._check_cob_balance(payment["practice_id"], eft["eft_num"], payment["num"], payment.get("status", ""))
-                chg_enc_not_found = self._check_chg_enc_not_found(payment["practice_id"], eft["eft_num"], payment["num"], payment.get("status", ""))
+                cob_balance, chg_enc_not_found = description_flags.get(
+                    (str(payment["practice_id"]), str(eft["eft_num"]), str(payment["num"])), ("", "")
+                )
                 
                 stats_row = {
                     'PRACTICE': str(payment["practice_id"]),
@@ -871,74 +1227,46 @@ class ExcelDataObjectCreator:
         print(f"✅ Stats Excel file created with {len(stats_data)} rows: {output_path}")
         return str(output_path)
         
-    def _check_cob_balance(self, practice_id: str, eft_num: str, pmt_num: str, status: str) -> str:
+    def _get_payment_description_flags(self) -> Dict[Tuple[str, str, str], Tuple[str, str]]:
         """
-        Check if any row in the same PRACTICE, EFT_NUM, PMT_NUM, STATUS has description containing 
+        Compute the COB Balance and CHG/ENC NOT FOUND flags for every payment in one pass over the rows.
+
+        COB Balance is "Y" when any row of the payment has a description containing
         "Payment not posted due to claim status" AND "matching COB balance".
-        
-        Args:
-            practice_id (str): Practice ID to filter by
-            eft_num (str): EFT number to filter by  
-            pmt_num (str): Payment number to filter by
-            status (str): Status to filter by
-            
-        Returns:
-            str: "Y" if condition is met, empty string otherwise
-        """
-        if self.df is None or 'Description' not in self.df.columns:
-            return ""
-            
-        # Filter rows for the same PRACTICE, EFT_NUM, PMT_NUM, STATUS
-        mask = (
-            (self.df['PRACTICE ID'].astype(str) == str(practice_id)) &
-            (self.df['EFT NUM'].astype(str) == str(eft_num)) &
-            (self.df['Chk Nbr'].astype(str) == str(pmt_num))
-        )
-        
-        filtered_rows = self.df[mask]
-        
-        # Check if any row has description containing both required phrases
-        for _, row in filtered_rows.iterrows():
-            description = str(row['Description']).strip().lower()
-            if ("payment not posted due to claim status" in description and 
-                "matching cob balance" in description):
-                return "Y"
-                
-        return ""
-        
-    def _check_chg_enc_not_found(self, practice_id: str, eft_num: str, pmt_num: str, status: str) -> str:
-        """
-        Check if any row in the same PRACTICE, EFT_NUM, PMT_NUM, STATUS has description containing
-        "Charge not found" OR "Encounter not found".
-        
-        Args:
-            practice_id (str): Practice ID to filter by
-            eft_num (str): EFT number to filter by
-            pmt_num (str): Payment number to filter by  
-            status (str): Status to filter by
-            
+        CHG/ENC NOT FOUND is "Y" when any row has a description containing
+        "Charge not found" OR "Encounter not found". Both checks ignore case.
+
         Returns:
-            str: "Y" if condition is met, empty string otherwise
+            Dict[Tuple[str, str, str], Tuple[str, str]]: (cob_balance, chg_enc_not_found) keyed by
+            (practice_id, eft_num, pmt_num), only for payments where at least one flag is set
         """
         if self.df is None or 'Description' not in self.df.columns:
-            return ""
-            
-        # Filter rows for the same PRACTICE, EFT_NUM, PMT_NUM, STATUS
-        mask = (
-            (self.df['PRACTICE ID'].astype(str) == str(practice_id)) &
-            (self.df['EFT NUM'].astype(str) == str(eft_num)) &
-            (self.df['Chk Nbr'].astype(str) == str(pmt_num))
-        )
-        
-        filtered_rows = self.df[mask]
-        
-        # Check if any row has description containing either phrase
-        for _, row in filtered_rows.iterrows():
-            description = str(row['Description']).strip().lower()
-            if ("charge not found" in description or "encounter not found" in description):
-                return "Y"
-                
-        return ""
+            return {}
+
+        descriptions = self.df['Description'].str.lower()
+        flags = pd.DataFrame({
+            'cob_balance': (
+                descriptions.str.contains("payment not posted due to claim status", regex=False) &
+                descriptions.str.contains("matching cob balance", regex=False)
+            ),
+            'chg_enc_not_found': (
+                descriptions.str.contains("charge not found", regex=False) |
+                descriptions.str.contains("encounter not found", regex=False)
+            ),
+        })
+
+        # Rows for the same PRACTICE, EFT_NUM, PMT_NUM share a group
+        payment_flags = flags.groupby(
+            [self.df['PRACTICE ID'], self.df['EFT NUM'], self.df['Chk Nbr']], sort=False
+        ).any()
+        payment_flags = payment_flags[payment_flags['cob_balance'] | payment_flags['chg_enc_not_found']]
+
+        return {
+            pmt_key: ("Y" if cob_balance else "", "Y" if chg_enc_not_found else "")
+            for pmt_key, cob_balance, chg_enc_not_found in zip(
+                payment_flags.index, payment_flags['cob_balance'], payment_flags['chg_enc_not_found']
+            )
+        }
 
 
 class AnalyticsProcessor:
@@ -975,61 +1303,87 @@ class AnalyticsProcessor:
             }
         }
 
-        # Process all EFTs and payments
-        for eft_num, eft in data_object.items():
-            # Only analyze not-split EFTs (single payment per EFT)
-            if not eft.get("is_split", False):
-                for payment_key, payment in eft["payments"].items():
-                    encs_to_check_count = len(payment.get("encs_to_check", {}))
-
-                    # Check if this payment has encounters to check (skip if none)
-                    if encs_to_check_count > 0:
-                        # Create payment info for analysis
-                        payment_info = {
-                            "eft_num": eft_num,
-                            "practice_id": payment["practice_id"],
-                            "payment_num": payment["num"],
-                            "payment_amount": payment["amt"],
-                            "encs_to_check_count": encs_to_check_count,
-                            "total_encounters": len(payment.get("encounters", {})),
-                            "pla_l6_count": len(payment["plas"]["pla_l6"]),
-                            "pla_other_count": len(payment["plas"]["pla_other"]),
-                            "payment_status": payment.get("status"),
-                            "encounters_to_check": payment.get("encs_to_check", {})
-                        }
-
-                        # Check for No Status 22 Scenarios
-                        self._analyze_no_status_22_scenarios(payment, payment_info, results)
-
-                        # Only analyze Mixed Post payments for existing scenarios
-                        if payment.get("status") == "Mixed Post":
-                            # Check PLA conditions
-                            has_l6_plas = len(payment["plas"]["pla_l6"]) > 0
-                            has_other_plas = len(payment["plas"]["pla_other"]) > 0
-                            has_no_plas = not has_l6_plas and not has_other_plas
-                            has_only_l6_plas = has_l6_plas and not has_other_plas
-
-                            # Scenario 1: Mixed Post with no PLAs
-                            if has_no_plas:
-                                results["mixed_post_no_plas"].append(payment_info)
-
-                            # Scenario 2: Mixed Post with only L6 PLAs
-                            if has_only_l6_plas:
-                                results["mixed_post_l6_only"].append(payment_info)
-
-                            # Check for "Charge mismatch on CPT4" encounters in this payment
-                            self._analyze_charge_mismatch_encounters(payment, payment_info, results)
+        # Flatten every payment into parallel columns once, then select scenarios with boolean masks
+        table = self._build_payment_table(data_object)
+        encs_to_check_counts = table["encs_to_check_count"]
+        pla_l6_counts = table["pla_l6_count"]
+        pla_other_counts = table["pla_other_count"]
+
+        # Only analyze not-split EFTs (single payment per EFT) with encounters to check
+        candidates = ~table["is_split"] & (encs_to_check_counts > 0)
+        mixed_post = candidates & (table["status"] == "Mixed Post")
+
+        # Create payment info for analysis
+        payment_infos = {}
+        for i in np.flatnonzero(candidates):
+            payment = table["payment"][i]
+            payment_infos[i] = {
+                "eft_num": table["eft_num"][i],
+                "practice_id": payment["practice_id"],
+                "payment_num": payment["num"],
+                "payment_amount": payment["amt"],
+                "encs_to_check_count": int(encs_to_check_counts[i]),
+                "total_encounters": len(payment.get("encounters", {})),
+                "pla_l6_count": int(pla_l6_counts[i]),
+                "pla_other_count": int(pla_other_counts[i]),
+                "payment_status": payment.get("status"),
+                "encounters_to_check": payment.get("encs_to_check", {})
+            }
+
+            # Check for No Status 22 Scenarios
+            self._analyze_no_status_22_scenarios(payment, payment_infos[i], results)
+
+        # Scenario 1: Mixed Post with no PLAs
+        no_plas = mixed_post & (pla_l6_counts == 0) & (pla_other_counts == 0)
+        results["mixed_post_no_plas"] = [payment_infos[i] for i in np.flatnonzero(no_plas)]
+
+        # Scenario 2: Mixed Post with only L6 PLAs
+        l6_only = mixed_post & (pla_l6_counts > 0) & (pla_other_counts == 0)
+        results["mixed_post_l6_only"] = [payment_infos[i] for i in np.flatnonzero(l6_only)]
+
+        # Check for "Charge mismatch on CPT4" encounters in Mixed Post payments
+        for i in np.flatnonzero(mixed_post):
+            self._analyze_charge_mismatch_encounters(table["payment"][i], payment_infos[i], results)
 
         # Sort results and find extremes
         self._process_analytics_results(results)
 
-        # Analyze max encounters across all EFTs and payments
-        self._analyze_max_encounters(data_object, results)
+        # Analyze max encounters across all EFTs and payments (from the same flattened table)
+        self._analyze_max_encounters(table, results)
 
         self.analytics_results = results
         print(f"✅ Mixed Post analytics completed")
         return results
 
+    def _build_payment_table(self, data_object: Dict) -> Dict[str, np.ndarray]:
+        """
+        Flatten all payments into parallel columns (one entry per payment, in data object order).
+
+        Args:
+            data_object (Dict): Complete data object with tagged payments and encounters
+
+        Returns:
+            Dict[str, np.ndarray]: Columns eft_num, payment, is_split, status, encs_to_check_count,
+                pla_l6_count and pla_other_count
+        """
+        rows = [
+            (eft_num, payment, eft.get("is_split", False), payment.get("status"),
+             len(payment.get("encs_to_check", {})), len(payment["plas"]["pla_l6"]), len(payment["plas"]["pla_other"]))
+            for eft_num, eft in data_object.items()
+            for payment in eft["payments"].values()
+        ]
+        eft_nums, payments, is_split, statuses, encs_counts, l6_counts, other_counts = zip(*rows) if rows else ([],) * 7
+
+        return {
+            "eft_num": list(eft_nums),
+            "payment": list(payments),
+            "is_split": np.array(is_split, dtype=bool),
+            "status": np.array(statuses, dtype=object),
+            "encs_to_check_count": np.array(encs_counts, dtype=np.int64),
+            "pla_l6_count": np.array(l6_counts, dtype=np.int64),
+            "pla_other_count": np.array(other_counts, dtype=np.int64)
+        }
+
     def _analyze_no_status_22_scenarios(self, payment: Dict, payment_info: Dict, results: Dict) -> None:
         """
         Analyze payments for "No Status 22 Scenarios" - payments that have encounters to check
@@ -1093,65 +1447,69 @@ class AnalyticsProcessor:
 
             results["charge_mismatch_cpt4_encounters"].append(encounter_info)
 
-    def _analyze_max_encounters(self, data_object: Dict, results: Dict) -> None:
+    def _analyze_max_encounters(self, table: Dict[str, np.ndarray], results: Dict) -> None:
         """
         Find the payment/EFT with the maximum encounters to check across different categories.
+        Works off the flattened payment table, so the data object is not walked again.
 
         Args:
-            data_object (Dict): Complete data object
+            table (Dict[str, np.ndarray]): Payment columns from _build_payment_table
             results (Dict): Results dictionary to update
         """
         max_not_split_payment = None
         max_split_eft = None
 
-        # Process all EFTs
-        for eft_num, eft in data_object.items():
-            if eft.get("is_split", False):
-                # Split EFT - calculate total encounters to check across all payments
-                total_encs_to_check = 0
-                for payment in eft["payments"].values():
-                    total_encs_to_check += len(payment.get("encs_to_check", {}))
-
-                if total_encs_to_check > 0:
-                    eft_info = {
-                        "eft_num": eft_num,
-                        "total_encs_to_check": total_encs_to_check,
-                        "payment_count": len(eft["payments"]),
-                        "payments": []
-                    }
+        eft_nums = table["eft_num"]
+        payments = table["payment"]
+        encs_to_check_counts = table["encs_to_check_count"]
+        is_split = table["is_split"]
+
+        # Not split EFT - single payment; first payment with the highest count wins
+        not_split = np.flatnonzero(~is_split & (encs_to_check_counts > 0))
+        if len(not_split):
+            i = not_split[np.argmax(encs_to_check_counts[not_split])]
+            payment = payments[i]
+            max_not_split_payment = {
+                "eft_num": eft_nums[i],
+                "practice_id": payment["practice_id"],
+                "payment_num": payment["num"],
+                "encs_to_check_count": int(encs_to_check_counts[i]),
+                "total_encounters": len(payment.get("encounters", {})),
+                "payment_status": payment.get("status", "Unknown"),
+                "pla_l6_count": int(table["pla_l6_count"][i]),
+                "pla_other_count": int(table["pla_other_count"][i])
+            }
 
-                    # Add ALL payment details (not just those with encounters to check)
-                    for payment in eft["payments"].values():
-                        payment_encs = len(payment.get("encs_to_check", {}))
-                        eft_info["payments"].append({
-                            "practice_id": payment["practice_id"],
-                            "payment_num": payment["num"],
-                            "encs_to_check": payment_encs,
-                            "status": payment.get("status", "Unknown"),
-                            "pla_l6_count": len(payment["plas"]["pla_l6"]),
-                            "pla_other_count": len(payment["plas"]["pla_other"])
-                        })
-
-                    if max_split_eft is None or total_encs_to_check > max_split_eft["total_encs_to_check"]:
-                        max_split_eft = eft_info
-            else:
-                # Not split EFT - single payment
-                for payment in eft["payments"].values():
-                    encs_to_check_count = len(payment.get("encs_to_check", {}))
-                    if encs_to_check_count > 0:
-                        payment_info = {
-                            "eft_num": eft_num,
-                            "practice_id": payment["practice_id"],
-                            "payment_num": payment["num"],
-                            "encs_to_check_count": encs_to_check_count,
-                            "total_encounters": len(payment.get("encounters", {})),
-                            "payment_status": payment.get("status", "Unknown"),
-                            "pla_l6_count": len(payment["plas"]["pla_l6"]),
-                            "pla_other_count": len(payment["plas"]["pla_other"])
-                        }
-
-                        if max_not_split_payment is None or encs_to_check_count > max_not_split_payment["encs_to_check_count"]:
-                            max_not_split_payment = payment_info
+        # Split EFT - calculate total encounters to check across all payments
+        split_rows = {}
+        for i in np.flatnonzero(is_split):
+            split_rows.setdefault(eft_nums[i], []).append(i)
+
+        max_split_rows = None
+        max_split_total = 0
+        for rows in split_rows.values():
+            total_encs_to_check = int(encs_to_check_counts[rows].sum())
+            if total_encs_to_check > max_split_total:
+                max_split_rows, max_split_total = rows, total_encs_to_check
+
+        if max_split_rows is not None:
+            max_split_eft = {
+                "eft_num": eft_nums[max_split_rows[0]],
+                "total_encs_to_check": max_split_total,
+                "payment_count": len(max_split_rows),
+                # Add ALL payment details (not just those with encounters to check)
+                "payments": [
+                    {
+                        "practice_id": payments[i]["practice_id"],
+                        "payment_num": payments[i]["num"],
+                        "encs_to_check": int(encs_to_check_counts[i]),
+                        "status": payments[i].get("status", "Unknown"),
+                        "pla_l6_count": int(table["pla_l6_count"][i]),
+                        "pla_other_count": int(table["pla_other_count"][i])
+                    }
+                    for i in max_split_rows
+                ]
+            }
 
         # Store results
         results["max_encounters_analysis"]["not_split_single_payment"] = max_not_split_payment
@@ -1164,17 +1522,20 @@ class AnalyticsProcessor:
         Args:
             results (Dict): Results dictionary to process
         """
+        # Full sorts are kept: the markdown lists every entry in this order, not just the extremes
+        by_encs_to_check = itemgetter("encs_to_check_count")
+
         # Sort No Status 22 scenarios by encounters to check count (descending)
-        results["no_status_22_scenarios"].sort(key=lambda x: x["encs_to_check_count"], reverse=True)
+        results["no_status_22_scenarios"].sort(key=by_encs_to_check, reverse=True)
 
         # Sort Mixed Post with no PLAs by encounters to check count (descending)
-        results["mixed_post_no_plas"].sort(key=lambda x: x["encs_to_check_count"], reverse=True)
+        results["mixed_post_no_plas"].sort(key=by_encs_to_check, reverse=True)
 
         # Sort Mixed Post with only L6 PLAs by encounters to check count (descending)
-        results["mixed_post_l6_only"].sort(key=lambda x: x["encs_to_check_count"], reverse=True)
+        results["mixed_post_l6_only"].sort(key=by_encs_to_check, reverse=True)
 
         # Sort charge mismatch encounters by encounters to check count (ascending for smallest)
-        results["charge_mismatch_cpt4_encounters"].sort(key=lambda x: x["encs_to_check_count"])
+        results["charge_mismatch_cpt4_encounters"].sort(key=by_encs_to_check)
 
         # Add summary statistics
         results["summary"] = {
@@ -1206,22 +1567,32 @@ class AnalyticsProcessor:
         results = self.analytics_results
         summary = results.get("summary", {})
 
+        # Bind each summary figure once rather than looking it up for both the test and the print
+        no_status_22_count = summary.get('no_status_22_scenarios_count', 0)
+        largest_no_status_22 = summary.get('largest_no_status_22_encs', 0)
+        no_plas_count = summary.get('mixed_post_no_plas_count', 0)
+        largest_no_plas = summary.get('largest_no_plas_encs', 0)
+        l6_only_count = summary.get('mixed_post_l6_only_count', 0)
+        largest_l6_only = summary.get('largest_l6_only_encs', 0)
+        charge_mismatch_count = summary.get('charge_mismatch_cpt4_count', 0)
+        smallest_charge_mismatch = summary.get('smallest_charge_mismatch_encs', 0)
+
         print(f"\n📊 Mixed Post Analytics Summary:")
-        print(f"   • No Status 22 Scenarios: {summary.get('no_status_22_scenarios_count', 0)} payments")
-        if summary.get('largest_no_status_22_encs', 0) > 0:
-            print(f"     └─ Largest encounters to check: {summary.get('largest_no_status_22_encs', 0)}")
+        print(f"   • No Status 22 Scenarios: {no_status_22_count} payments")
+        if largest_no_status_22 > 0:
+            print(f"     └─ Largest encounters to check: {largest_no_status_22}")
 
-        print(f"   • Mixed Post with No PLAs: {summary.get('mixed_post_no_plas_count', 0)} payments")
-        if summary.get('largest_no_plas_encs', 0) > 0:
-            print(f"     └─ Largest encounters to check: {summary.get('largest_no_plas_encs', 0)}")
+        print(f"   • Mixed Post with No PLAs: {no_plas_count} payments")
+        if largest_no_plas > 0:
+            print(f"     └─ Largest encounters to check: {largest_no_plas}")
 
-        print(f"   • Mixed Post with L6 PLAs Only: {summary.get('mixed_post_l6_only_count', 0)} payments")
-        if summary.get('largest_l6_only_encs', 0) > 0:
-            print(f"     └─ Largest encounters to check: {summary.get('largest_l6_only_encs', 0)}")
+        print(f"   • Mixed Post with L6 PLAs Only: {l6_only_count} payments")
+        if largest_l6_only > 0:
+            print(f"     └─ Largest encounters to check: {largest_l6_only}")
 
-        print(f"   • Charge Mismatch CPT4 Encounters: {summary.get('charge_mismatch_cpt4_count', 0)} payments")
-        if summary.get('smallest_charge_mismatch_encs', 0) > 0:
-            print(f"     └─ Smallest encounters to check: {summary.get('smallest_charge_mismatch_encs', 0)}")
+        print(f"   • Charge Mismatch CPT4 Encounters: {charge_mismatch_count} payments")
+        if smallest_charge_mismatch > 0:
+            print(f"     └─ Smallest encounters to check: {smallest_charge_mismatch}")
 
         # Show max encounters analysis
         max_analysis = results.get("max_encounters_analysis", {})
@@ -1277,8 +1648,16 @@ class EncounterTagger:
     Updates the data object with encounter tags and encs_to_check.
     """
 
-    def __init__(self):
-        """Initialize the encounter tagger."""
+    def __init__(self, max_workers: Optional[int] = None, verbose: bool = False):
+        """
+        Initialize the encounter tagger.
+
+        Args:
+            max_workers (int, optional): Number of worker processes for tagging EFTs (None or 1 runs sequentially)
+            verbose (bool): Print a progress line per EFT
+        """
+        self.max_workers = max_workers
+        self.verbose = verbose
         self.encounter_tags = [
             "22_no_123", "22_with_123", "appeal_has_adj", "chg_equal_adj",
             "secondary_n408_pr96", "secondary_co94_oa94", "secondary_mc_tricare_dshs",
@@ -1298,50 +1677,68 @@ class EncounterTagger:
         """
         print(f"🏷️ Tagging encounters for review...")
 
-        for eft_num, eft in data_object.items():
-            print(f"   📊 Processing EFT: {eft_num}")
-
-            for payment_key, payment in eft["payments"].items():
-                encs_to_check = {}
-
-                for encounter_key, encounter in payment["encounters"].items():
-                    # Perform encounter analysis
-                    review_data = self.encounter_quick_check(payment, encounter, eft["payer"])
-
-                    if review_data:
-                        # Add tags to encounter
-                        encounter["tags"] = list(review_data["types"].keys())
-
-                        # Add to encs_to_check
-                        encs_to_check[encounter_key] = review_data
-
-                # Sort encounters to check by encounter number and then by status
-                sorted_encs_to_check = {}
-                if encs_to_check:
-                    # Create sorting tuples: (encounter_num, status, original_key)
-                    sort_items = []
-                    for enc_key, enc_data in encs_to_check.items():
-                        enc_num = enc_data.get("num", "")
-                        enc_status = enc_data.get("clm_status", "")
-                        sort_items.append((enc_num, enc_status, enc_key, enc_data))
-
-                    # Sort by encounter number first, then by status
-                    sort_items.sort(key=lambda x: (x[0], x[1]))
-
-                    # Rebuild the sorted dictionary
-                    for _, _, enc_key, enc_data in sort_items:
-                        sorted_encs_to_check[enc_key] = enc_data
-
-                # Update payment with sorted encs_to_check
-                payment["encs_to_check"] = sorted_encs_to_check
-                
-                # Update the encounter count
-                payment["encs_to_check_count"] = len(sorted_encs_to_check)
+        if self.max_workers and self.max_workers > 1 and len(data_object) > 1:
+            # Each EFT is tagged independently, so tag them across worker processes;
+            # map() yields results in submission order, matching the data object keys
+            chunksize = max(1, len(data_object) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                tagged_efts = executor.map(self._tag_eft, data_object.keys(), data_object.values(), chunksize=chunksize)
+                for eft_num, tagged_eft in zip(list(data_object.keys()), tagged_efts):
+                    data_object[eft_num] = tagged_eft
+        else:
+            for eft_num, eft in data_object.items():
+                self._tag_eft(eft_num, eft)
 
         print(f"✅ Encounter tagging completed")
         return data_object
 
-    def encounter_quick_check(self, payment: Dict, encounter: Dict, payer: str) -> Optional[Dict]:
+    def _tag_eft(self, eft_num: str, eft: Dict) -> Dict:
+        """
+        Tag the encounters of every payment in one EFT and set each payment's encs_to_check.
+
+        Args:
+            eft_num (str): EFT number
+            eft (Dict): EFT object with payments and encounters
+
+        Returns:
+            Dict: The same EFT object, updated in place
+        """
+        if self.verbose:
+            print(f"   📊 Processing EFT: {eft_num}")
+
+        for payment_key, payment in eft["payments"].items():
+            encs_to_check = {}
+
+            # Bucket the payment's CPT4s by encounter number and claim status once, in a single pass
+            cpt4_buckets = self._build_cpt4_buckets(payment["encounters"])
+
+            for encounter_key, encounter in payment["encounters"].items():
+                # Perform encounter analysis
+                review_data = self.encounter_quick_check(payment, encounter, eft["payer"], cpt4_buckets)
+
+                if review_data:
+                    # Add tags to encounter
+                    encounter["tags"] = list(review_data["types"].keys())
+
+                    # Add to encs_to_check
+                    encs_to_check[encounter_key] = review_data
+
+            # Sort encounters to check by encounter number and then by status
+            sorted_encs_to_check = dict(sorted(
+                encs_to_check.items(),
+                key=lambda item: (item[1].get("num", ""), item[1].get("clm_status", ""))
+            ))
+
+            # Update payment with sorted encs_to_check
+            payment["encs_to_check"] = sorted_encs_to_check
+
+            # Update the encounter count
+            payment["encs_to_check_count"] = len(sorted_encs_to_check)
+
+        return eft
+
+    def encounter_quick_check(self, payment: Dict, encounter: Dict, payer: str,
+                              cpt4_buckets: Optional[Dict[str, Tuple[set, set]]] = None) -> Optional[Dict]:
         """
         Perform quick check analysis on a single encounter within a payment.
 
@@ -1349,148 +1746,121 @@ class EncounterTagger:
             payment (Dict): Payment object with all encounters
             encounter (Dict): Specific encounter to analyze
             payer (str): Payer name from EFT
+            cpt4_buckets (Dict, optional): Per-number CPT4 sets from _build_cpt4_buckets (built here if omitted)
 
         Returns:
             Optional[Dict]: Analysis results for this specific encounter or None if no review needed
         """
         encounter_num = encounter["num"]
 
-        # Define service pairs for charge mismatch checking
-        service_pairs = {("99202", "99212"), ("99203", "99213"), ("99204", "99214"), ("99205", "99215"), ("99206", "99216")}
-
-        # Create all_encounters for payment encounters where encounter number matches
-        all_encounters = {}
-        for enc_key, enc_data in payment["encounters"].items():
-            if enc_data["num"] == encounter_num:
-                all_encounters[enc_key] = enc_data
-
-        # Filter encounters by claim status for the matching encounter number
-        recoupment_encounters = {k: v for k, v in all_encounters.items() if v["status"] == "22"}
-        non_recoupment_encounters = {k: v for k, v in all_encounters.items() if v["status"] != "22"}
-
-        primary_encounters = {k: v for k, v in non_recoupment_encounters.items()
-                            if v["status"] in ["1", "19"]}
-        secondary_encounters = {k: v for k, v in non_recoupment_encounters.items()
-                              if v["status"] in ["2", "20"]}
-        tertiary_encounters = {k: v for k, v in non_recoupment_encounters.items()
-                             if v["status"].startswith("3") or v["status"] == "21"}
-
-        # Get services from each encounter type for the matching encounter number
-        recoupment_services = []
-        for enc in recoupment_encounters.values():
-            recoupment_services.extend(enc["services"])
-
-        primary_services = []
-        for enc in primary_encounters.values():
-            primary_services.extend(enc["services"])
-
-        secondary_services = []
-        for enc in secondary_encounters.values():
-            secondary_services.extend(enc["services"])
-
-        tertiary_services = []
-        for enc in tertiary_encounters.values():
-            tertiary_services.extend(enc["services"])
-
-        # Get CPT4 lists for comparison
-        primary_cpt4s = {svc["cpt4"] for svc in primary_services if svc["cpt4"]}
-        secondary_cpt4s = {svc["cpt4"] for svc in secondary_services if svc["cpt4"]}
-        tertiary_cpt4s = {svc["cpt4"] for svc in tertiary_services if svc["cpt4"]}
-        recoupment_cpt4s = {svc["cpt4"] for svc in recoupment_services if svc["cpt4"]}
+        # Get CPT4 sets for every encounter in the payment sharing this encounter number
+        if cpt4_buckets is None:
+            cpt4_buckets = self._build_cpt4_buckets(payment["encounters"])
+        other_cpt4s, recoupment_cpt4s = cpt4_buckets[encounter_num]
 
         # Analyze services in the specific encounter
         encounter_tags_found = {}
 
         for service in encounter["services"]:
             enc_type = self._analyze_service(
-                service, payer, primary_cpt4s, secondary_cpt4s,
-                tertiary_cpt4s, recoupment_cpt4s, service_pairs
+                service, payer, other_cpt4s, recoupment_cpt4s
             )
 
             if enc_type:
+                # Collect CPT4s per type as a set, so duplicates merge as they are found
                 if enc_type not in encounter_tags_found:
-                    encounter_tags_found[enc_type] = []
-                encounter_tags_found[enc_type].append(service["cpt4"])
+                    encounter_tags_found[enc_type] = set()
+                encounter_tags_found[enc_type].add(service.cpt4)
 
         # Return analysis for this specific encounter
         if encounter_tags_found:
-            # Merge services by type (remove duplicates)
-            for enc_type in encounter_tags_found:
-                encounter_tags_found[enc_type] = list(set(encounter_tags_found[enc_type]))
-
             return {
                 "num": encounter["num"],
                 "clm_status": encounter["status"],
-                "types": encounter_tags_found
+                "types": {enc_type: list(cpt4s) for enc_type, cpt4s in encounter_tags_found.items()}
             }
         else:
             return None
 
-    def _analyze_service(self, service: Dict, payer: str, primary_cpt4s: set,
-                        secondary_cpt4s: set, tertiary_cpt4s: set, recoupment_cpt4s: set,
-                        service_pairs: set) -> Optional[str]:
+    def _build_cpt4_buckets(self, encounters: Dict) -> Dict[str, Tuple[set, set]]:
+        """
+        Collect CPT4 codes per encounter number in one pass over a payment.
+
+        Primary (1, 19), secondary (2, 20) and tertiary (3x, 21) CPT4s are only ever checked together,
+        so they share one set; recoupment (22) CPT4s get their own. Other statuses are not collected.
+
+        Args:
+            encounters (Dict): Payment encounters keyed by (enc_nbr, clm_sts)
+
+        Returns:
+            Dict[str, Tuple[set, set]]: (primary/secondary/tertiary, recoupment) CPT4 sets by encounter number
+        """
+        buckets = {}
+
+        for enc in encounters.values():
+            status = enc["status"]
+            if status == "22":
+                bucket_index = 1
+            elif status in NON_RECOUPMENT_STATUSES or status.startswith("3"):
+                bucket_index = 0
+            else:
+                bucket_index = None
+
+            # Create the sets only the first time an encounter number is seen
+            enc_buckets = buckets.get(enc["num"])
+            if enc_buckets is None:
+                enc_buckets = buckets[enc["num"]] = (set(), set())
+
+            if bucket_index is not None:
+                # map/filter keep the gather in C rather than a Python-level generator per encounter
+                enc_buckets[bucket_index].update(filter(None, map(SERVICE_CPT4, enc["services"])))
+
+        return buckets
+
+    def _analyze_service(self, service: Service, payer: str, other_cpt4s: set,
+                        recoupment_cpt4s: set) -> Optional[str]:
         """
         Analyze a single service to determine encounter type tag.
 
         Args:
-            service (Dict): Service object
+            service (Service): Service object
             payer (str): Payer name
-            primary_cpt4s (set): Set of primary service CPT4 codes
-            secondary_cpt4s (set): Set of secondary service CPT4 codes
-            tertiary_cpt4s (set): Set of tertiary service CPT4 codes
+            other_cpt4s (set): Set of primary, secondary and tertiary service CPT4 codes
             recoupment_cpt4s (set): Set of recoupment service CPT4 codes
-            service_pairs (set): Set of service pairs for charge mismatch checking
 
         Returns:
             Optional[str]: Encounter type tag or None if no tag applies
         """
-        description = service.get("description", "").strip()
-        posted_sts = service.get("posting_sts", "").strip()
-        clm_sts = service.get("clm_sts", "").strip()
-        cpt4 = service.get("cpt4", "").strip()
-        txn_status = service.get("txn_status", "").strip()
-        bill_amt = service.get("bill_amt", "").strip()
-        paid_amt = service.get("paid_amt", "").strip()
-        codes = service.get("codes", [])
-        remarks = service.get("remarks", [])
+        description = service.description
+        posted_sts = service.posting_sts
+        clm_sts = service.clm_sts
+        cpt4 = service.cpt4
+        txn_status = service.txn_status
+        bill_amt = service.bill_amt
+        paid_amt = service.paid_amt
+        codes = service.codes
+        remarks = service.remarks
 
         # HANDLE NOT POSTED
-        if description == "Encounter payer not found.":
-            return "enc_payer_not_found"
-
-        if description == "Charge mismatch on amount.":
-            return "multiple_to_one"
-
-        if description == "Multiple payments found for the same line item.":
-            return "multiple_to_one"
-
-        if description == "Service line payments do not sum to claim level payment.":
-            return "svc_no_match_clm"
-
-        if description == "Charge mismatch on CPT4.":
-            return "chg_mismatch_cpt4"
+        description_tag = NOT_POSTED_DESCRIPTION_TAGS.get(description)
+        if description_tag:
+            return description_tag
 
         if posted_sts == "Not Posted":
             return "other_not_posted"
 
-        # Get service pairs and opposite CPT4 for use in both recoupment and non-recoupment logic
-        opposite_cpt4 = None
-        for pair in service_pairs:
-            if cpt4 in pair:
-                opposite_cpt4 = pair[1] if pair[0] == cpt4 else pair[0]
-                break
+        # Get opposite CPT4 from the service pairs for use in both recoupment and non-recoupment logic
+        opposite_cpt4 = OPPOSITE_CPT4.get(cpt4)
 
         # HANDLE RECOUPMENT
         if clm_sts == "22":
             # If opposite CPT4 is in primary, secondary, or tertiary services, return None
             if opposite_cpt4:
-                all_other_cpt4s = primary_cpt4s | secondary_cpt4s | tertiary_cpt4s
-                if opposite_cpt4 in all_other_cpt4s:
+                if opposite_cpt4 in other_cpt4s:
                     return None
 
             # Otherwise follow the standard 22 checks
-            all_other_cpt4s = primary_cpt4s | secondary_cpt4s | tertiary_cpt4s
-            if cpt4 in all_other_cpt4s:
+            if cpt4 in other_cpt4s:
                 return "22_with_123"
             else:
                 return "22_no_123"
@@ -1513,16 +1883,20 @@ class EncounterTagger:
         # HANDLE SECONDARY
         # Secondary claim status specific checks
         if clm_sts in ["2", "20"]:
-            # Check for N408 + PR96 + (CO45 or OA23)
-            if self._has_codes(codes + remarks, ["N408", "PR96"]) and \
-               self._has_codes(codes + remarks, ["CO45", "OA23"], any_match=True):
-                return "secondary_n408_pr96"
+            # Reason and remark codes as one bitmask, built only when the service has any codes
+            if codes or remarks:
+                code_mask = 0
+                for code in codes + remarks:
+                    code_mask |= CODE_BIT.get(code, 0)
 
-            # Check for (CO94 or OA94) + (CO45 or OA23) + PR96
-            if self._has_codes(codes + remarks, ["CO94", "OA94"], any_match=True) and \
-               self._has_codes(codes + remarks, ["CO45", "OA23"], any_match=True) and \
-               self._has_codes(codes + remarks, ["PR96"]):
-                return "secondary_co94_oa94"
+                if code_mask & CODES_CO45_OA23:
+                    # Check for N408 + PR96 + (CO45 or OA23)
+                    if code_mask & CODES_N408_PR96 == CODES_N408_PR96:
+                        return "secondary_n408_pr96"
+
+                    # Check for (CO94 or OA94) + (CO45 or OA23) + PR96
+                    if code_mask & CODES_PR96 and code_mask & CODES_CO94_OA94:
+                        return "secondary_co94_oa94"
 
             # Check for Medicare/Tricare/DSHS
             if payer in ["Medicare", "Tricare", "DSHS"]:
@@ -1534,42 +1908,21 @@ class EncounterTagger:
 
         return None
 
-    def _has_adjustment(self, service: Dict) -> bool:
+    def _has_adjustment(self, service: Service) -> bool:
         """Check if service has non-zero adjustment amount."""
-        adj_amt = self._get_adj_amt(service)
-        try:
-            return float(adj_amt) != 0.0
-        except (ValueError, TypeError):
-            return False
+        adj_amt = _parse_amount(self._get_adj_amt(service))
+        return adj_amt is not None and adj_amt != 0.0
 
-    def _get_adj_amt(self, service: Dict) -> str:
+    def _get_adj_amt(self, service: Service) -> str:
         """Get adjustment amount from service (placeholder - you may need to specify the field)."""
         # You'll need to specify which field contains the adjustment amount
-        return service.get("adj_amt", "0")
+        return getattr(service, "adj_amt", "0")
 
     def _amounts_equal(self, amount1: str, amount2: str) -> bool:
         """Compare two string amounts for equality."""
-        try:
-            return float(amount1) == float(amount2)
-        except (ValueError, TypeError):
-            return False
-
-    def _has_codes(self, code_list: List[str], required_codes: List[str], any_match: bool = False) -> bool:
-        """
-        Check if required codes are present in the code list.
-
-        Args:
-            code_list (List[str]): List of codes to search in
-            required_codes (List[str]): List of required codes
-            any_match (bool): If True, any code match is sufficient; if False, all codes required
-
-        Returns:
-            bool: True if criteria is met
-        """
-        if any_match:
-            return any(code in code_list for code in required_codes)
-        else:
-            return all(code in code_list for code in required_codes)
+        value1 = _parse_amount(amount1)
+        value2 = _parse_amount(amount2)
+        return value1 is not None and value2 is not None and value1 == value2
 
 
 class PaymentTagger:
@@ -1578,34 +1931,44 @@ class PaymentTagger:
     Updates the data object with payment statuses and EFT split status.
     """
 
-    def __init__(self):
-        """Initialize the payment tagger."""
+    def __init__(self, verbose: bool = False):
+        """
+        Initialize the payment tagger.
+
+        Args:
+            verbose (bool): Print a progress line per EFT
+        """
+        self.verbose = verbose
         # Define encounter type categories for payment status determination
-        self.not_posted_list = [
+        # (frozensets so each category test is a single set intersection)
+        self.not_posted_list = frozenset([
             "enc_payer_not_found",
             "multiple_to_one",
             "other_not_posted",
             "svc_no_match_clm",
             "chg_mismatch_cpt4"
-        ]
+        ])
 
-        self.check_ng_and_data = [
+        self.check_ng_and_data = frozenset([
             "secondary_co94_oa94",
             "secondary_mc_tricare_dshs",
             "tertiary"
-        ]
+        ])
 
-        self.reversals = [
+        self.reversals = frozenset([
             "22_no_123",
             "22_with_123"
-        ]
+        ])
 
         # Define Quick Post specific encounter types
-        self.quick_post_types = [
+        self.quick_post_types = frozenset([
             "appeal_has_adj",
             "chg_equal_adj",
             "secondary_n408_pr96"
-        ]
+        ])
+
+        # Payment status by (has_plas, encounter types) signature
+        self._status_cache = {}
 
     def tag_payments(self, data_object: Dict) -> Dict:
         """
@@ -1620,7 +1983,8 @@ class PaymentTagger:
         print(f"🏷️ Tagging payments and EFTs...")
 
         for eft_num, eft in data_object.items():
-            print(f"   📊 Processing EFT: {eft_num}")
+            if self.verbose:
+                print(f"   📊 Processing EFT: {eft_num}")
 
             # Tag EFT as split or not split based on number of payments
             eft["is_split"] = len(eft["payments"]) > 1
@@ -1650,44 +2014,55 @@ class PaymentTagger:
         Returns:
             str: Payment status
         """
-        # Check if payment has PLAs
-        has_plas = (len(payment["plas"]["pla_l6"]) > 0 or
-                   len(payment["plas"]["pla_other"]) > 0)
-
         # Get all encounter types that need to be checked
         encs_to_check = payment.get("encs_to_check", {})
 
-        # 1. Immediate Post: no plas, no encounters to check
-        if not has_plas and not encs_to_check:
-            return "Immediate Post"
-
-        # 2. PLA Only: has plas, no encounters to check
-        if has_plas and not encs_to_check:
-            return "PLA Only"
-
-        # If there are encounters to check, get all encounter types
-        if encs_to_check:
-            all_encounter_types = set()
-            for enc_data in encs_to_check.values():
-                all_encounter_types.update(enc_data.get("types", {}).keys())
-
-            # 3. Mixed Post: has at least one enc_to_check in not_posted_list
-            if any(enc_type in self.not_posted_list for enc_type in all_encounter_types):
-                return "Mixed Post"
-
-            # For remaining checks, payment should not have PLAs
-            if not has_plas:
-                # 4. Quick Post: no plas, has ONLY quick_post_types encounters
-                if all_encounter_types and all_encounter_types.issubset(set(self.quick_post_types)):
-                    return "Quick Post"
-
-                # 5. Full Post: no plas, has encounters in check_ng_and_data or reversals
-                has_check_ng_or_reversals = (
-                    any(enc_type in self.check_ng_and_data for enc_type in all_encounter_types) or
-                    any(enc_type in self.reversals for enc_type in all_encounter_types)
-                )
-                if has_check_ng_or_reversals:
-                    return "Full Post"
+        # Check if payment has PLAs
+        plas = payment["plas"]
+        has_plas = bool(plas["pla_l6"] or plas["pla_other"])
+
+        # 1. Immediate Post / 2. PLA Only: no encounters to check, decided by PLAs alone
+        if not encs_to_check:
+            return "PLA Only" if has_plas else "Immediate Post"
+
+        # Union of encounter types across every encounter to check
+        all_encounter_types = frozenset().union(*(enc_data.get("types", {}).keys() for enc_data in encs_to_check.values()))
+
+        # Many payments share the same (has_plas, encounter types) signature, so resolve each signature once
+        signature = (has_plas, all_encounter_types)
+        status = self._status_cache.get(signature)
+        if status is None:
+            status = self._status_cache[signature] = self._status_from_encounter_types(has_plas, all_encounter_types)
+        return status
+
+    def _status_from_encounter_types(self, has_plas: bool, all_encounter_types: frozenset) -> str:
+        """
+        Resolve the status of a payment that has encounters to check (statuses 3-6 below).
+
+        Args:
+            has_plas (bool): Whether the payment has any PLAs
+            all_encounter_types (frozenset): Union of encounter types across encs_to_check
+
+        Returns:
+            str: Payment status
+        """
+        # 3. Mixed Post: has at least one enc_to_check in not_posted_list
+        if not self.not_posted_list.isdisjoint(all_encounter_types):
+            return "Mixed Post"
+
+        # For remaining checks, payment should not have PLAs
+        if not has_plas:
+            # 4. Quick Post: no plas, has ONLY quick_post_types encounters
+            if all_encounter_types and all_encounter_types <= self.quick_post_types:
+                return "Quick Post"
+
+            # 5. Full Post: no plas, has encounters in check_ng_and_data or reversals
+            has_check_ng_or_reversals = (
+                not self.check_ng_and_data.isdisjoint(all_encounter_types) or
+                not self.reversals.isdisjoint(all_encounter_types)
+            )
+            if has_check_ng_or_reversals:
+                return "Full Post"
 
         # 6. Fallback for any payment not fitting the above categories
         return "Unknown"
\ No newline at end of file
@@ -5,6 +5,11 @@ This module defines custom exception classes for the PHIL Analytics library
 to provide clear error handling and debugging information.
 """
 
+import logging
+
+# Construction details go to debug logging; handlers print the formatted error when it is caught
+logger = logging.getLogger(__name__)
+
 
 class PhilAnalyticsError(Exception):
     """
@@ -26,7 +31,7 @@ class PhilAnalyticsError(Exception):
         super().__init__(message)
         self.error_code = error_code
         self.details = details or {}
-        print(f"❌ PHIL Analytics Error: {message}")
+        logger.debug("PHIL Analytics Error: %s", message)
 
     def __str__(self):
         """Return a formatted error message."""
@@ -66,7 +71,7 @@ class DataProcessingError(PhilAnalyticsError):
             details['column'] = column
 
         super().__init__(message, error_code="DATA_PROCESSING", details=details)
-        print(f"🔧 Data processing failed at operation: {operation}")
+        logger.debug("Data processing failed at operation: %s", operation)
 
 
 class FileNotFoundError(PhilAnalyticsError):
@@ -92,7 +97,7 @@ class FileNotFoundError(PhilAnalyticsError):
             message += f" (Expected in: {expected_location})"
 
         super().__init__(message, error_code="FILE_NOT_FOUND", details=details)
-        print(f"📁 Missing {file_type}: {file_path}")
+        logger.debug("Missing %s: %s", file_type, file_path)
 
 
 class ValidationError(PhilAnalyticsError):
@@ -122,7 +127,7 @@ class ValidationError(PhilAnalyticsError):
             details['actual'] = actual
 
         super().__init__(message, error_code="VALIDATION", details=details)
-        print(f"✅ Validation failed: {validation_type}")
+        logger.debug("Validation failed: %s", validation_type)
 
 
 class MappingError(PhilAnalyticsError):
@@ -152,7 +157,7 @@ class MappingError(PhilAnalyticsError):
             details['lookup_key'] = lookup_key
 
         super().__init__(message, error_code="MAPPING", details=details)
-        print(f"🗺️ Mapping error in {mapping_type}: {lookup_key}")
+        logger.debug("Mapping error in %s: %s", mapping_type, lookup_key)
 
 
 class ConfigurationError(PhilAnalyticsError):
@@ -179,7 +184,7 @@ class ConfigurationError(PhilAnalyticsError):
             details['config_value'] = config_value
 
         super().__init__(message, error_code="CONFIGURATION", details=details)
-        print(f"⚙️ Configuration error: {config_key}")
+        logger.debug("Configuration error: %s", config_key)
 
 
 class AnalyticsError(PhilAnalyticsError):
@@ -206,7 +211,7 @@ class AnalyticsError(PhilAnalyticsError):
             details['payer_folder'] = payer_folder
 
         super().__init__(message, error_code="ANALYTICS", details=details)
-        print(f"📊 Analytics generation failed: {analytics_type}")
+        logger.debug("Analytics generation failed: %s", analytics_type)
 
 
 # Utility function for error reporting
@@ -5,10 +5,15 @@ This module generates markdown files from the complete data object.
 Creates {filename}_efts.md with encounters that need review.
 """
 
-from typing import Dict, List, Optional
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, TextIO, Tuple
 from pathlib import Path
 from collections import defaultdict
 
+# Write buffer for the markdown files; sections are small, so a large buffer turns them into few write calls
+MARKDOWN_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class MarkdownGenerator:
     """
@@ -16,14 +21,16 @@ class MarkdownGenerator:
     Creates nested markdown with GitHub-style toggles for encounters that need review.
     """
 
-    def __init__(self, payer_name: str):
+    def __init__(self, payer_name: str, max_workers: Optional[int] = None):
         """
         Initialize the markdown generator.
 
         Args:
             payer_name (str): Name of the payer folder being processed
+            max_workers (int, optional): Number of worker processes for rendering split EFTs and detailed payments (None or 1 runs sequentially)
         """
         self.payer_name = payer_name
+        self.max_workers = max_workers
 
     def generate_efts_markdown(self, data_object: Dict, output_dir: str = ".", missing_encounter_efts: Optional[List[str]] = None, analytics_results: Optional[Dict] = None) -> str:
         """
@@ -67,76 +74,184 @@ class MarkdownGenerator:
 
         return filtered_file_path
 
-    def _generate_main_efts_file(self, data_object: Dict, output_dir: str, missing_encounter_efts: Optional[List[str]], analytics_results: Optional[Dict]) -> str:
-        """Generate the main combined EFTs markdown file."""
-        markdown_content = []
-        markdown_content.append(f"# {self.payer_name} EFTs Analysis\n\n")
+    def generate_all_efts_markdown(self, data_object: Dict, output_dir: str = ".", missing_encounter_efts: Optional[List[str]] = None, analytics_results: Optional[Dict] = None) -> Tuple[str, str]:
+        """
+        Generate both {payer}_efts.md and {payer}_efts_filtered.md from the same (pre-filtered) data object.
+        The sections the two files share are rendered once and written to both.
+
+        Args:
+            data_object (Dict): Pre-filtered data object with only desired EFTs
+            output_dir (str): Directory to save the markdown files
+            missing_encounter_efts (List[str], optional): List of EFT NUMs with missing encounters/charges
+            analytics_results (Dict, optional): Analytics results from AnalyticsProcessor
+
+        Returns:
+            Tuple[str, str]: Paths to the saved main and filtered markdown files
+        """
+        # Sort the EFT numbers once for the split section order and the filtered file's EFT list
+        sorted_eft_nums = sorted(data_object)
+        review_sections = self._render_review_sections(data_object, analytics_results, sorted_eft_nums)
+
+        print(f"📝 Generating EFTs markdown for {self.payer_name}...")
+        main_file_path = self._generate_main_efts_file(data_object, output_dir, missing_encounter_efts, analytics_results, review_sections)
+
+        print(f"📝 Generating filtered EFTs markdown for {self.payer_name}...")
+        print(f"   📊 Processing {len(data_object)} filtered EFTs")
+        filtered_file_path = self._generate_filtered_efts_file(data_object, output_dir, missing_encounter_efts, analytics_results, review_sections, sorted_eft_nums)
+
+        return main_file_path, filtered_file_path
 
-        # Add link to It Shoulds at the very top
-        self._generate_it_shoulds_link_section(markdown_content)
+    def _generate_main_efts_file(self, data_object: Dict, output_dir: str, missing_encounter_efts: Optional[List[str]], analytics_results: Optional[Dict],
+                                 review_sections: Optional[str] = None) -> str:
+        """Generate the main combined EFTs markdown file, streaming each section straight to disk."""
+        output_path = Path(output_dir) / f"{self.payer_name}_efts.md"
+        with self._open_markdown_file(output_path) as markdown_content:
+            markdown_content.write(f"# {self.payer_name} EFTs Analysis\n\n")
+
+            # Add link to It Shoulds at the very top
+            self._generate_it_shoulds_link_section(markdown_content)
+
+            # Add missing encounter/charge EFTs section if any exist
+            if missing_encounter_efts and len(missing_encounter_efts) > 0:
+                self._generate_missing_encounter_charge_efts_section(missing_encounter_efts, markdown_content)
+
+            # Add Mixed Post Scenarios and Payments to Review sections (shared with the filtered file)
+            if review_sections is None:
+                self._write_review_sections(data_object, analytics_results, markdown_content)
+            else:
+                markdown_content.write(review_sections)
+
+        print(f"   ✅ EFTs markdown saved to: {output_path}")
+        return str(output_path)
 
-        # Add missing encounter/charge EFTs section if any exist
-        if missing_encounter_efts and len(missing_encounter_efts) > 0:
-            self._generate_missing_encounter_charge_efts_section(missing_encounter_efts, markdown_content)
+    def _render_review_sections(self, data_object: Dict, analytics_results: Optional[Dict], sorted_eft_nums: Optional[List[str]] = None) -> str:
+        """
+        Render the analytics scenario sections and the "Payments to Review" EFT sections.
+        Both EFTs markdown files end with this same content for the same data object.
+
+        Args:
+            data_object (Dict): Data object with tagged EFTs
+            analytics_results (Dict, optional): Analytics results from AnalyticsProcessor
+            sorted_eft_nums (List[str], optional): All EFT numbers already in sorted order
 
+        Returns:
+            str: Markdown for the analytics and Payments to Review sections
+        """
+        markdown_content = io.StringIO()
+        self._write_review_sections(data_object, analytics_results, markdown_content, sorted_eft_nums)
+        return markdown_content.getvalue()
+
+    def _write_review_sections(self, data_object: Dict, analytics_results: Optional[Dict], markdown_content: TextIO,
+                               sorted_eft_nums: Optional[List[str]] = None) -> None:
+        """
+        Write the analytics scenario sections and the "Payments to Review" EFT sections.
+
+        Args:
+            data_object (Dict): Data object with tagged EFTs
+            analytics_results (Dict, optional): Analytics results from AnalyticsProcessor
+            markdown_content (TextIO): Buffer or file to write markdown content to
+            sorted_eft_nums (List[str], optional): All EFT numbers already in sorted order
+        """
         # Add Mixed Post Scenarios section
         if analytics_results:
             self._generate_no_status_22_scenarios_section(analytics_results, markdown_content)
             self._generate_mixed_post_scenarios_section(analytics_results, markdown_content)
 
         # Add "Payments to Review" H2 heading before the EFTs sections
-        markdown_content.append("## Payments to Review\n\n")
+        markdown_content.write("## Payments to Review\n\n")
 
-        # Separate EFTs by split status
-        not_split_efts = {}
-        split_efts = {}
-
-        for eft_num, eft in data_object.items():
-            if eft['is_split']:
-                split_efts[eft_num] = eft
-            else:
-                not_split_efts[eft_num] = eft
+        # Separate EFTs by split status, grouping the not-split payments by status in the same pass
+        # (split EFTs are listed in EFT number order)
+        not_split_count, payment_groups, split_eft_nums = self._partition_efts(data_object, sorted_eft_nums)
 
         # Generate "EFTs - Not Split" section grouped by payment status
-        self._generate_not_split_section(not_split_efts, markdown_content)
+        self._generate_not_split_section(not_split_count, payment_groups, markdown_content)
 
         # Generate "EFTs - Split" section grouped by EFT
-        self._generate_split_section(split_efts, markdown_content)
+        self._generate_split_section(data_object, split_eft_nums, markdown_content)
 
-        # Save markdown file
-        output_path = Path(output_dir) / f"{self.payer_name}_efts.md"
+    def _partition_efts(self, data_object: Dict, sorted_eft_nums: Optional[List[str]] = None) -> Tuple[int, Dict[str, List[Dict]], List[str]]:
+        """
+        Split the EFTs into not-split and split EFTs in a single pass over the data object,
+        building the payment info for each not-split payment as it is reached.
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(''.join(markdown_content))
+        Args:
+            data_object (Dict): Data object with tagged EFTs
+            sorted_eft_nums (List[str], optional): All EFT numbers already in sorted order; when given,
+                the split EFTs are picked from it instead of being sorted again
 
-        print(f"   ✅ EFTs markdown saved to: {output_path}")
-        return str(output_path)
+        Returns:
+            Tuple[int, Dict[str, List[Dict]], List[str]]: Number of not-split EFTs, not-split payment infos
+            grouped by payment status in data object order, and split EFT numbers in EFT number order
+        """
+        not_split_count = 0
+        payment_groups = defaultdict(list)
+        split_eft_nums = []
 
-    def _generate_missing_encounter_charge_efts_section(self, missing_encounter_efts: List[str], markdown_content: List[str]) -> None:
+        for eft_num, eft in data_object.items():
+            if eft['is_split']:
+                split_eft_nums.append(eft_num)
+                continue
+
+            not_split_count += 1
+            # Each not-split EFT should have exactly one payment
+            for payment_key, payment in eft["payments"].items():
+                # Counts are kept on the payment by the creator and EncounterTagger
+                payment_groups[payment.get("status", "Unknown")].append({
+                    'payment_key': payment_key,
+                    'eft_num': eft_num,
+                    'practice_id': payment['practice_id'],
+                    'pmt_num': payment['num'],
+                    'encs_to_check_count': payment["encs_to_check_count"],
+                    'total_encounters': payment["total_encounters"],
+                    'pla_count': len(payment["plas"]["pla_l6"]) + len(payment["plas"]["pla_other"]),
+                    'payment': payment
+                })
+
+        if sorted_eft_nums is not None:
+            split_eft_nums = [eft_num for eft_num in sorted_eft_nums if data_object[eft_num]['is_split']]
+        else:
+            split_eft_nums.sort()
+        return not_split_count, payment_groups, split_eft_nums
+
+    def _open_markdown_file(self, output_path: Path) -> TextIO:
+        """
+        Open a markdown file for streaming writes as UTF-8, without newline translation,
+        behind a MARKDOWN_WRITE_BUFFER_SIZE byte buffer.
+
+        Args:
+            output_path (Path): Path of the markdown file to write
+
+        Returns:
+            TextIO: Writable text file; sections are written to it as they are generated
+        """
+        return open(output_path, 'w', encoding='utf-8', newline='', buffering=MARKDOWN_WRITE_BUFFER_SIZE)
+
+    def _generate_missing_encounter_charge_efts_section(self, missing_encounter_efts: List[str], markdown_content: TextIO) -> None:
         """
         Generate the "EFTs with Encounters/Charge Not Found" section.
 
         Args:
             missing_encounter_efts (List[str]): List of EFT NUMs with missing encounters/charges
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
-        markdown_content.append(f"## EFTs with Encounters/Charge Not Found ({len(missing_encounter_efts)})\n\n")
+        markdown_content.write(f"## EFTs with Encounters/Charge Not Found ({len(missing_encounter_efts)})\n\n")
 
         if missing_encounter_efts:
             for eft_num in sorted(missing_encounter_efts):
-                markdown_content.append(f"* {eft_num}\n")
+                markdown_content.write(f"* {eft_num}\n")
         else:
-            markdown_content.append("None\n")
+            markdown_content.write("None\n")
 
-        markdown_content.append("\n")
+        markdown_content.write("\n")
 
-    def _generate_mixed_post_scenarios_section(self, analytics_results: Dict, markdown_content: List[str]) -> None:
+    def _generate_mixed_post_scenarios_section(self, analytics_results: Dict, markdown_content: TextIO) -> None:
         """
         Generate the "Mixed Post Scenarios" section with analytics insights as H2 with nested toggles.
 
         Args:
             analytics_results (Dict): Analytics results from AnalyticsProcessor
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
         summary = analytics_results.get("summary", {})
 
@@ -148,239 +263,283 @@ class MarkdownGenerator:
         )
 
         # Main Mixed Post Scenarios as H2
-        markdown_content.append(f"## Mixed Post Scenarios ({total_scenarios})\n\n")
+        markdown_content.write(f"## Mixed Post Scenarios ({total_scenarios})\n\n")
 
         # Mixed Post with No PLAs
         no_plas_count = summary.get("mixed_post_no_plas_count", 0)
-        markdown_content.append(f"<details markdown=\"1\">\n<summary>Mixed Post with No PLAs ({no_plas_count})</summary>\n\n")
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>Mixed Post with No PLAs ({no_plas_count})</summary>\n\n")
 
         if analytics_results.get("mixed_post_no_plas"):
             # Show ALL payments with most encounters to check first
             all_no_plas = analytics_results["mixed_post_no_plas"]  # Already sorted by encounters to check (descending)
             for payment in all_no_plas:
-                markdown_content.append(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to Check\n")
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to Check\n")
         else:
-            markdown_content.append("None found.\n")
+            markdown_content.write("None found.\n")
 
-        markdown_content.append("\n</details>\n\n")
+        markdown_content.write("\n</details>\n\n")
 
         # Mixed Post with L6 PLAs Only
         l6_only_count = summary.get("mixed_post_l6_only_count", 0)
-        markdown_content.append(f"<details markdown=\"1\">\n<summary>Mixed Post with L6 PLAs Only ({l6_only_count})</summary>\n\n")
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>Mixed Post with L6 PLAs Only ({l6_only_count})</summary>\n\n")
 
         if analytics_results.get("mixed_post_l6_only"):
             # Show ALL payments with most encounters to check first
             all_l6_only = analytics_results["mixed_post_l6_only"]  # Already sorted by encounters to check (descending)
             for payment in all_l6_only:
-                markdown_content.append(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to check, {payment['pla_l6_count']} L6 PLAs\n")
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to check, {payment['pla_l6_count']} L6 PLAs\n")
         else:
-            markdown_content.append("None found.\n")
+            markdown_content.write("None found.\n")
 
-        markdown_content.append("\n</details>\n\n")
+        markdown_content.write("\n</details>\n\n")
 
         # Charge Mismatch CPT4 Encounters
         charge_mismatch_count = summary.get("charge_mismatch_cpt4_count", 0)
-        markdown_content.append(f"<details markdown=\"1\">\n<summary>Charge Mismatch CPT4 Encounters ({charge_mismatch_count})</summary>\n\n")
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>Charge Mismatch CPT4 Encounters ({charge_mismatch_count})</summary>\n\n")
 
         if analytics_results.get("charge_mismatch_cpt4_encounters"):
             # Show ALL payments with smallest number of encounters to check first (easier to review first)
             all_charge_mismatch = analytics_results["charge_mismatch_cpt4_encounters"]  # Already sorted by encounters to check (ascending)
             for payment in all_charge_mismatch:
                 charge_mismatch_count = payment.get("charge_mismatch_count", 1)
-                markdown_content.append(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to check ({charge_mismatch_count} charge mismatch encounters)\n")
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to check ({charge_mismatch_count} charge mismatch encounters)\n")
         else:
-            markdown_content.append("None found.\n")
+            markdown_content.write("None found.\n")
 
-        markdown_content.append("\n</details>\n\n")
+        markdown_content.write("\n</details>\n\n")
 
         # Max Encounters to Check as H2 (separate from Mixed Post Scenarios)
         max_analysis = analytics_results.get("max_encounters_analysis", {})
         if max_analysis.get("not_split_single_payment") or max_analysis.get("split_single_eft"):
-            markdown_content.append(f"## Max Encounters to Check\n\n")
+            markdown_content.write(f"## Max Encounters to Check\n\n")
 
             if max_analysis.get("not_split_single_payment"):
                 max_payment = max_analysis["not_split_single_payment"]
-                markdown_content.append(f"* **Not Split Payment:** {max_payment['practice_id']}_{max_payment['payment_num']} - {max_payment['encs_to_check_count']}\n")
+                markdown_content.write(f"* **Not Split Payment:** {max_payment['practice_id']}_{max_payment['payment_num']} - {max_payment['encs_to_check_count']}\n")
 
             if max_analysis.get("split_single_eft"):
                 max_eft = max_analysis["split_single_eft"]
-                markdown_content.append(f"* **Split EFT:** {max_eft['eft_num']} - {max_eft['total_encs_to_check']}\n")
+                markdown_content.write(f"* **Split EFT:** {max_eft['eft_num']} - {max_eft['total_encs_to_check']}\n")
 
-            markdown_content.append("\n")
+            markdown_content.write("\n")
 
-    def _generate_it_shoulds_link_section(self, markdown_content: List[str]) -> None:
+    def _generate_it_shoulds_link_section(self, markdown_content: TextIO) -> None:
         """
         Generate the link to the "It Shoulds" Notion page.
 
         Args:
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
-        markdown_content.append("## Link to \"It Shoulds\"\n\n")
-        markdown_content.append("[PS1D - PHIL \"It Should\"](https://www.notion.so/thoughtfulautomation/PS1D-PHIL-It-Should-1f8f43a78fa48033931ceded894c60ce)\n\n")
+        markdown_content.write("## Link to \"It Shoulds\"\n\n")
+        markdown_content.write("[PS1D - PHIL \"It Should\"](https://www.notion.so/thoughtfulautomation/PS1D-PHIL-It-Should-1f8f43a78fa48033931ceded894c60ce)\n\n")
 
-    def _generate_no_status_22_scenarios_section(self, analytics_results: Dict, markdown_content: List[str]) -> None:
+    def _generate_no_status_22_scenarios_section(self, analytics_results: Dict, markdown_content: TextIO) -> None:
         """
         Generate the "No Status 22 Scenarios" section with payments that have encounters to check but no status 22.
 
         Args:
             analytics_results (Dict): Analytics results from AnalyticsProcessor
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
         summary = analytics_results.get("summary", {})
         no_status_22_count = summary.get("no_status_22_scenarios_count", 0)
 
         # No Status 22 Scenarios as H2
-        markdown_content.append(f"## No Status 22 Scenarios ({no_status_22_count})\n\n")
+        markdown_content.write(f"## No Status 22 Scenarios ({no_status_22_count})\n\n")
 
         if analytics_results.get("no_status_22_scenarios"):
             # Show ALL payments with most encounters to check first
             all_no_status_22 = analytics_results["no_status_22_scenarios"]  # Already sorted by encounters to check (descending)
             for payment in all_no_status_22:
-                markdown_content.append(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to Check ({payment['payment_status']})\n")
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['payment_num']}**: {payment['encs_to_check_count']} to Check ({payment['payment_status']})\n")
         else:
-            markdown_content.append("None found.\n")
+            markdown_content.write("None found.\n")
 
-        markdown_content.append("\n")
+        markdown_content.write("\n")
 
-    def _generate_not_split_section(self, not_split_efts: Dict, markdown_content: List[str]) -> None:
+    def _generate_not_split_section(self, not_split_count: int, payment_groups: Dict[str, List[Dict]], markdown_content: TextIO) -> None:
         """
         Generate the "EFTs - Not Split" section organized by payment status.
         Uses simple bullet list for Immediate Post and detailed format for others.
 
         Args:
-            not_split_efts (Dict): Dictionary of not-split EFTs
-            markdown_content (List[str]): List to append markdown content to
+            not_split_count (int): Number of not-split EFTs
+            payment_groups (Dict[str, List[Dict]]): Not-split payment infos grouped by payment status, as built by _partition_efts
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
-        # Group payments by status
-        payment_groups = defaultdict(list)
-
-        for eft_num, eft in not_split_efts.items():
-            # Each not-split EFT should have exactly one payment
-            for payment_key, payment in eft["payments"].items():
-                payment_status = payment.get("status", "Unknown")
-
-                # Calculate counts
-                encs_to_check_count = len(payment.get("encs_to_check", {}))
-                total_encounters = len(payment.get("encounters", {}))
-                pla_count = len(payment["plas"]["pla_l6"]) + len(payment["plas"]["pla_other"])
-
-                payment_info = {
-                    'payment_key': payment_key,
-                    'eft_num': eft_num,
-                    'practice_id': payment['practice_id'],
-                    'pmt_num': payment['num'],
-                    'encs_to_check_count': encs_to_check_count,
-                    'total_encounters': total_encounters,
-                    'pla_count': pla_count,
-                    'payment': payment,
-                    'eft': eft
-                }
-
-                payment_groups[payment_status].append(payment_info)
-
         # Define the order of payment statuses
         status_order = ["Immediate Post", "PLA Only", "Quick Post", "Full Post", "Mixed Post"]
 
-        not_split_title = f"EFTs - Not Split ({len(not_split_efts)})"
-        markdown_content.append(f"<details markdown=\"1\">\n<summary>{not_split_title}</summary>\n\n")
+        # Sort payments by practice_id then pmt_num within each status
+        sorted_groups = {
+            status: sorted(payment_groups.get(status, []), key=lambda x: (x['practice_id'], x['pmt_num']))
+            for status in status_order
+        }
 
-        for status in status_order:
-            payments = payment_groups.get(status, [])
-            status_title = f"{status} ({len(payments)})"
-            markdown_content.append(f"<details markdown=\"1\">\n<summary>{status_title}</summary>\n\n")
+        # Detailed payment blocks are independent, so render them across worker processes when enabled;
+        # map() yields results in submission order, so the blocks are consumed in output order below
+        detailed_blocks = None
+        detailed_infos = [info for status in status_order if status != "Immediate Post" for info in sorted_groups[status]]
+        if self.max_workers and self.max_workers > 1 and len(detailed_infos) > 1:
+            chunksize = max(1, len(detailed_infos) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                detailed_blocks = iter(list(executor.map(self._render_not_split_payment, detailed_infos, chunksize=chunksize)))
+
+        not_split_title = f"EFTs - Not Split ({not_split_count})"
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>{not_split_title}</summary>\n\n")
 
-            if payments:
-                # Sort payments by practice_id then pmt_num
-                sorted_payments = sorted(payments, key=lambda x: (x['practice_id'], x['pmt_num']))
+        for status in status_order:
+            sorted_payments = sorted_groups[status]
+            status_title = f"{status} ({len(sorted_payments)})"
+            markdown_content.write(f"<details markdown=\"1\">\n<summary>{status_title}</summary>\n\n")
 
+            if sorted_payments:
                 for payment_info in sorted_payments:
                     if status == "Immediate Post":
                         # Simple bullet list format for Immediate Post
-                        markdown_content.append(f"- {payment_info['practice_id']}_{payment_info['pmt_num']} (EFT: {payment_info['eft_num']} ENCS:{payment_info['encs_to_check_count']}/{payment_info['total_encounters']} TO CHECK)\n")
+                        markdown_content.write(f"- {payment_info['practice_id']}_{payment_info['pmt_num']} (EFT: {payment_info['eft_num']} ENCS:{payment_info['encs_to_check_count']}/{payment_info['total_encounters']} TO CHECK)\n")
+                    elif detailed_blocks is not None:
+                        markdown_content.write(next(detailed_blocks))
                     else:
-                        # Detailed format for all other payment types
-                        markdown_content.append(f"* **{payment_info['practice_id']}_{payment_info['pmt_num']} (EFT: {payment_info['eft_num']} ENCS:{payment_info['encs_to_check_count']}/{payment_info['total_encounters']} TO CHECK)**\n\n")
+                        self._generate_not_split_payment(payment_info, markdown_content)
+            else:
+                markdown_content.write("No payments in this category.\n\n")
 
-                        # Add detailed payment content
-                        has_plas = payment_info['pla_count'] > 0
-                        has_encounters_to_check = payment_info['encs_to_check_count'] > 0
+            markdown_content.write("</details>\n\n")  # Close status group
 
-                        if has_plas or has_encounters_to_check:
-                            self._generate_detailed_payment_content(payment_info['payment'], markdown_content, has_plas, has_encounters_to_check)
+        markdown_content.write("</details>\n\n")  # Close EFTs - Not Split
 
-                        markdown_content.append("\n")
-            else:
-                markdown_content.append("No payments in this category.\n\n")
+    def _render_not_split_payment(self, payment_info: Dict) -> str:
+        """
+        Render one detailed not-split payment block to a string (used by worker processes).
 
-            markdown_content.append("</details>\n\n")  # Close status group
+        Args:
+            payment_info (Dict): Payment info with its counts, as grouped by _partition_efts
 
-        markdown_content.append("</details>\n\n")  # Close EFTs - Not Split
+        Returns:
+            str: Markdown for the payment line and its details
+        """
+        markdown_content = io.StringIO()
+        self._generate_not_split_payment(payment_info, markdown_content)
+        return markdown_content.getvalue()
 
-    def _generate_split_section(self, split_efts: Dict, markdown_content: List[str]) -> None:
+    def _generate_not_split_payment(self, payment_info: Dict, markdown_content: TextIO) -> None:
         """
-        Generate the "EFTs - Split" section organized by EFT number.
+        Generate the detailed entry for one not-split payment (every status except Immediate Post).
 
         Args:
-            split_efts (Dict): Dictionary of split EFTs
-            markdown_content (List[str]): List to append markdown content to
+            payment_info (Dict): Payment info with its counts, as grouped by _partition_efts
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
-        split_title = f"EFTs - Split ({len(split_efts)})"
-        markdown_content.append(f"<details markdown=\"1\">\n<summary>{split_title}</summary>\n\n")
+        markdown_content.write(f"* **{payment_info['practice_id']}_{payment_info['pmt_num']} (EFT: {payment_info['eft_num']} ENCS:{payment_info['encs_to_check_count']}/{payment_info['total_encounters']} TO CHECK)**\n\n")
 
-        for eft_num in sorted(split_efts.keys()):
-            eft = split_efts[eft_num]
+        # Add detailed payment content
+        has_plas = payment_info['pla_count'] > 0
+        has_encounters_to_check = payment_info['encs_to_check_count'] > 0
 
-            # Calculate totals across all payments in this EFT
-            total_encs_to_check = 0
-            total_plas = 0
+        if has_plas or has_encounters_to_check:
+            self._generate_detailed_payment_content(payment_info['payment'], markdown_content, has_plas, has_encounters_to_check)
 
-            for payment in eft["payments"].values():
-                total_encs_to_check += len(payment.get("encs_to_check", {}))
-                total_plas += len(payment["plas"]["pla_l6"]) + len(payment["plas"]["pla_other"])
+        markdown_content.write("\n")
+
+    def _generate_split_section(self, data_object: Dict, split_eft_nums: List[str], markdown_content: TextIO) -> None:
+        """
+        Generate the "EFTs - Split" section organized by EFT number.
+
+        Args:
+            data_object (Dict): Complete data object
+            split_eft_nums (List[str]): EFT numbers of the split EFTs, in output order
+            markdown_content (TextIO): Buffer or file to write markdown content to
+        """
+        split_title = f"EFTs - Split ({len(split_eft_nums)})"
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>{split_title}</summary>\n\n")
+
+        if self.max_workers and self.max_workers > 1 and len(split_eft_nums) > 1:
+            # Each split EFT renders to an independent block, so render them across worker processes;
+            # map() yields results in submission order, so the EFT order is kept
+            chunksize = max(1, len(split_eft_nums) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                split_efts = (data_object[eft_num] for eft_num in split_eft_nums)
+                markdown_content.writelines(executor.map(self._render_split_eft, split_eft_nums, split_efts, chunksize=chunksize))
+        else:
+            for eft_num in split_eft_nums:
+                self._generate_split_eft(eft_num, data_object[eft_num], markdown_content)
 
-            eft_title = f"{eft_num} (Payments: {len(eft['payments'])}, Encs To Check: {total_encs_to_check}, PLAs: {total_plas})"
-            markdown_content.append(f"<details markdown=\"1\">\n<summary>{eft_title}</summary>\n\n")
+        markdown_content.write("</details>\n\n")  # Close EFTs - Split
 
-            # Sort payments by practice_id then payment number
-            sorted_payments = sorted(eft["payments"].items(),
-                                   key=lambda x: (x[1]['practice_id'], x[1]['num']))
+    def _render_split_eft(self, eft_num: str, eft: Dict) -> str:
+        """
+        Render one split EFT block to a string (used by worker processes).
 
-            for payment_key, payment in sorted_payments:
-                # Calculate counts for this payment
-                encs_to_check_count = len(payment.get("encs_to_check", {}))
-                pla_count = len(payment["plas"]["pla_l6"]) + len(payment["plas"]["pla_other"])
-                payment_status = payment.get("status", "Unknown")
+        Args:
+            eft_num (str): EFT number
+            eft (Dict): Split EFT object
 
-                # Check if there's any content to show
-                has_plas = pla_count > 0
-                has_encounters_to_check = encs_to_check_count > 0
+        Returns:
+            str: Markdown for the EFT toggle and its payments
+        """
+        markdown_content = io.StringIO()
+        self._generate_split_eft(eft_num, eft, markdown_content)
+        return markdown_content.getvalue()
 
-                # Get encounter counts for this payment
-                total_encounters = len(payment.get("encounters", {}))
-                
-                if payment_status == "Immediate Post":
-                    # Simple bullet list format for Immediate Post in split EFTs
-                    markdown_content.append(f"* **{payment['practice_id']}_{payment['num']} (EFT: {eft_num} ENCS:{encs_to_check_count}/{total_encounters} TO CHECK \"{payment_status}\")**\n")
-                else:
-                    # Detailed format for all other payment types in split EFTs
-                    markdown_content.append(f"* **{payment['practice_id']}_{payment['num']} (EFT: {eft_num} ENCS:{encs_to_check_count}/{total_encounters} TO CHECK \"{payment_status}\")**\n\n")
+    def _generate_split_eft(self, eft_num: str, eft: Dict, markdown_content: TextIO) -> None:
+        """
+        Generate the toggle for one split EFT with each of its payments.
 
-                    if has_plas or has_encounters_to_check:
-                        self._generate_detailed_payment_content(payment, markdown_content, has_plas, has_encounters_to_check)
+        Args:
+            eft_num (str): EFT number
+            eft (Dict): Split EFT object
+            markdown_content (TextIO): Buffer or file to write markdown content to
+        """
+        # Count each payment once, accumulating the EFT totals in the same pass
+        total_encs_to_check = 0
+        total_plas = 0
+        payment_counts = []
+
+        for payment in eft["payments"].values():
+            encs_to_check_count = payment["encs_to_check_count"]
+            pla_count = len(payment["plas"]["pla_l6"]) + len(payment["plas"]["pla_other"])
+            total_encs_to_check += encs_to_check_count
+            total_plas += pla_count
+            payment_counts.append((payment, encs_to_check_count, pla_count))
+
+        eft_title = f"{eft_num} (Payments: {len(eft['payments'])}, Encs To Check: {total_encs_to_check}, PLAs: {total_plas})"
+        markdown_content.write(f"<details markdown=\"1\">\n<summary>{eft_title}</summary>\n\n")
+
+        # Sort payments by practice_id then payment number
+        sorted_payments = sorted(payment_counts, key=lambda x: (x[0]['practice_id'], x[0]['num']))
+
+        for payment, encs_to_check_count, pla_count in sorted_payments:
+            payment_status = payment.get("status", "Unknown")
+
+            # Check if there's any content to show
+            has_plas = pla_count > 0
+            has_encounters_to_check = encs_to_check_count > 0
+
+            # Get encounter counts for this payment
+            total_encounters = payment["total_encounters"]
+            
+            if payment_status == "Immediate Post":
+                # Simple bullet list format for Immediate Post in split EFTs
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['num']} (EFT: {eft_num} ENCS:{encs_to_check_count}/{total_encounters} TO CHECK \"{payment_status}\")**\n")
+            else:
+                # Detailed format for all other payment types in split EFTs
+                markdown_content.write(f"* **{payment['practice_id']}_{payment['num']} (EFT: {eft_num} ENCS:{encs_to_check_count}/{total_encounters} TO CHECK \"{payment_status}\")**\n\n")
 
-                markdown_content.append("\n")
+                if has_plas or has_encounters_to_check:
+                    self._generate_detailed_payment_content(payment, markdown_content, has_plas, has_encounters_to_check)
 
-            markdown_content.append("</details>\n\n")  # Close EFT
+            markdown_content.write("\n")
 
-        markdown_content.append("</details>\n\n")  # Close EFTs - Split
+        markdown_content.write("</details>\n\n")  # Close EFT
 
-    def _generate_detailed_payment_content(self, payment: Dict, markdown_content: List[str], has_plas: bool, has_encounters_to_check: bool) -> None:
+    def _generate_detailed_payment_content(self, payment: Dict, markdown_content: TextIO, has_plas: bool, has_encounters_to_check: bool) -> None:
         """
         Generate detailed payment content with proper indentation.
 
         Args:
             payment (Dict): Payment object
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
             has_plas (bool): Whether this payment has PLAs
             has_encounters_to_check (bool): Whether this payment has encounters to check
         """
@@ -389,58 +548,49 @@ class MarkdownGenerator:
             pla_l6_count = len(payment["plas"]["pla_l6"])
             pla_other_count = len(payment["plas"]["pla_other"])
 
-            markdown_content.append(f"  * **PLAs** (L6: {pla_l6_count}, Other: {pla_other_count})\n\n")
+            markdown_content.write(f"  * **PLAs** (L6: {pla_l6_count}, Other: {pla_other_count})\n\n")
 
             # Add PLA amount breakdown
             self._generate_pla_amount_breakdown_indented(payment, markdown_content)
 
-            # Add L6 PLAs if present
+            # Add L6 PLAs if present (each list is joined and written as one block)
             if payment["plas"]["pla_l6"]:
-                markdown_content.append("    * **L6 PLAs:**\n")
-                for pla in payment["plas"]["pla_l6"]:
-                    markdown_content.append(f"      * {pla}\n")
-                markdown_content.append("\n")
+                pla_lines = "".join([f"      * {pla}\n" for pla in payment["plas"]["pla_l6"]])
+                markdown_content.write(f"    * **L6 PLAs:**\n{pla_lines}\n")
 
             # Add Other PLAs if present
             if payment["plas"]["pla_other"]:
-                markdown_content.append("    * **Other PLAs:**\n")
-                for pla in payment["plas"]["pla_other"]:
-                    markdown_content.append(f"      * {pla}\n")
-                markdown_content.append("\n")
+                pla_lines = "".join([f"      * {pla}\n" for pla in payment["plas"]["pla_other"]])
+                markdown_content.write(f"    * **Other PLAs:**\n{pla_lines}\n")
 
         # Encounters section - removed the parent "Encounters to Check" header
         if has_encounters_to_check:
             encs_to_check = payment.get("encs_to_check", {})
 
-            if has_plas:
-                # If we have PLAs, use proper indentation to continue the bullet
-                encounter_indent = "  "
-                sub_indent = "    "
-            else:
-                # If no PLAs, start fresh bullet
-                encounter_indent = "  "
-                sub_indent = "    "
-
+            # Encounters use the same indentation whether or not a PLA section precedes them
             for enc_key, enc_check_data in encs_to_check.items():
-                markdown_content.append(f"{encounter_indent}* **Encounter:** {enc_check_data['num']} (Status: {enc_check_data['clm_status']})\n")
+                encounter_lines = [f"  * **Encounter:** {enc_check_data['num']} (Status: {enc_check_data['clm_status']})\n"]
 
-                # Add encounter analysis as sub-bullets
+                # Add encounter analysis as sub-bullets (joining an empty CPT4 list already gives "")
                 for enc_type, cpt4_list in enc_check_data['types'].items():
-                    cpt4_str = ", ".join(cpt4_list) if cpt4_list else ""
+                    cpt4_str = ", ".join(cpt4_list)
                     if cpt4_str:
-                        markdown_content.append(f"{sub_indent}* {enc_type}: {cpt4_str}\n")
+                        encounter_lines.append(f"    * {enc_type}: {cpt4_str}\n")
                     else:
-                        markdown_content.append(f"{sub_indent}* {enc_type}\n")
+                        encounter_lines.append(f"    * {enc_type}\n")
+
+                # One buffer write per encounter rather than one per line
+                markdown_content.write("".join(encounter_lines))
 
-            markdown_content.append("\n")
+            markdown_content.write("\n")
 
-    def _generate_pla_amount_breakdown_indented(self, payment: Dict, markdown_content: List[str]) -> None:
+    def _generate_pla_amount_breakdown_indented(self, payment: Dict, markdown_content: TextIO) -> None:
         """
         Generate the PLA amount breakdown with proper indentation for nested structure.
 
         Args:
             payment (Dict): Payment object with PLA amounts
-            markdown_content (List[str]): List to append markdown content to
+            markdown_content (TextIO): Buffer or file to write markdown content to
         """
         # Get the amounts from the payment object
         payment_amount = payment.get("amt", 0.0)  # Payment Amount from the file split
@@ -450,10 +600,12 @@ class MarkdownGenerator:
         # (Adding because PLAs are already in their correct sign - positive PLAs increase balance, negative PLAs decrease balance)
         ledger_balance = payment_amount + pla_other_amts
 
-        # Properly indented 3-line format
-        markdown_content.append(f"    * Payment Amount: ${payment_amount:,.2f}\n")
-        markdown_content.append(f"    * Other PLAs: ${pla_other_amts:,.2f}\n")
-        markdown_content.append(f"    * Ledger Balance: ${ledger_balance:,.2f}\n\n")
+        # Properly indented 3-line format, written as a single block
+        markdown_content.write(
+            f"    * Payment Amount: ${payment_amount:,.2f}\n"
+            f"    * Other PLAs: ${pla_other_amts:,.2f}\n"
+            f"    * Ledger Balance: ${ledger_balance:,.2f}\n\n"
+        )
 
     def generate_summary_stats(self, data_object: Dict, missing_encounter_efts: Optional[List[str]] = None) -> Dict:
         """
@@ -488,8 +640,8 @@ class MarkdownGenerator:
             stats['total_payments'] += len(eft['payments'])
 
             for payment in eft['payments'].values():
-                stats['total_encounters'] += len(payment['encounters'])
-                stats['total_encounters_to_check'] += len(payment.get('encs_to_check', {}))
+                stats['total_encounters'] += payment['total_encounters']
+                stats['total_encounters_to_check'] += payment['encs_to_check_count']
 
                 # Track payment status counts
                 payment_status = payment.get('status', 'Unknown')
@@ -506,18 +658,9 @@ class MarkdownGenerator:
         return stats
 
 
-    def _generate_filtered_efts_file(self, filtered_data_object: Dict, output_dir: str, missing_encounter_efts: Optional[List[str]], analytics_results: Optional[Dict]) -> str:
-        """Generate the filtered EFTs markdown file."""
-        markdown_content = []
-        markdown_content.append(f"# {self.payer_name} EFTs Analysis - Filtered\n\n")
-
-        # Add info about the filter (show which EFTs are included)
-        eft_list = ', '.join(sorted(filtered_data_object.keys()))
-        markdown_content.append(f"**Filtered EFTs ({len(filtered_data_object)}):** {eft_list}\n\n")
-
-        # Add link to It Shoulds at the very top
-        self._generate_it_shoulds_link_section(markdown_content)
-
+    def _generate_filtered_efts_file(self, filtered_data_object: Dict, output_dir: str, missing_encounter_efts: Optional[List[str]], analytics_results: Optional[Dict],
+                                     review_sections: Optional[str] = None, sorted_eft_nums: Optional[List[str]] = None) -> str:
+        """Generate the filtered EFTs markdown file, streaming each section straight to disk."""
         # Filter missing encounter EFTs if provided
         filtered_missing_encounter_efts = []
         if missing_encounter_efts:
@@ -525,39 +668,27 @@ class MarkdownGenerator:
                 if eft_num in filtered_data_object:
                     filtered_missing_encounter_efts.append(eft_num)
 
-        # Add missing encounter/charge EFTs section if any exist
-        if filtered_missing_encounter_efts:
-            self._generate_missing_encounter_charge_efts_section(filtered_missing_encounter_efts, markdown_content)
+        output_path = Path(output_dir) / f"{self.payer_name}_efts_filtered.md"
+        with self._open_markdown_file(output_path) as markdown_content:
+            markdown_content.write(f"# {self.payer_name} EFTs Analysis - Filtered\n\n")
 
-        # Add analytics results if provided (they will already be filtered since they're based on the filtered data object)
-        if analytics_results:
-            self._generate_no_status_22_scenarios_section(analytics_results, markdown_content)
-            self._generate_mixed_post_scenarios_section(analytics_results, markdown_content)
+            # Add info about the filter (show which EFTs are included)
+            eft_list = ', '.join(sorted_eft_nums if sorted_eft_nums is not None else sorted(filtered_data_object))
+            markdown_content.write(f"**Filtered EFTs ({len(filtered_data_object)}):** {eft_list}\n\n")
 
-        # Add "Payments to Review" H2 heading before the EFTs sections
-        markdown_content.append("## Payments to Review\n\n")
+            # Add link to It Shoulds at the very top
+            self._generate_it_shoulds_link_section(markdown_content)
 
-        # Separate EFTs by split status
-        not_split_efts = {}
-        split_efts = {}
+            # Add missing encounter/charge EFTs section if any exist
+            if filtered_missing_encounter_efts:
+                self._generate_missing_encounter_charge_efts_section(filtered_missing_encounter_efts, markdown_content)
 
-        for eft_num, eft in filtered_data_object.items():
-            if eft['is_split']:
-                split_efts[eft_num] = eft
+            # Add analytics results if provided (they will already be filtered since they're based on the filtered data object)
+            # and the Payments to Review sections (shared with the main file)
+            if review_sections is None:
+                self._write_review_sections(filtered_data_object, analytics_results, markdown_content)
             else:
-                not_split_efts[eft_num] = eft
-
-        # Generate "EFTs - Not Split" section grouped by payment status
-        self._generate_not_split_section(not_split_efts, markdown_content)
-
-        # Generate "EFTs - Split" section grouped by EFT
-        self._generate_split_section(split_efts, markdown_content)
-
-        # Save markdown file
-        output_path = Path(output_dir) / f"{self.payer_name}_efts_filtered.md"
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(''.join(markdown_content))
+                markdown_content.write(review_sections)
 
         print(f"   ✅ Filtered EFTs markdown saved to: {output_path}")
         return str(output_path)
@@ -27,7 +27,8 @@ class PhilPipeline:
     def __init__(self, payer_folder: str, input_folder: Optional[str] = None,
                  output_folder: Optional[str] = None, mapping_file: Optional[str] = None,
                  max_files: Optional[int] = None, save_combined: bool = True,
-                 payments_filter: Optional[str] = None):
+                 payments_filter: Optional[str] = None, generate_markdown: bool = True,
+                 max_workers: Optional[int] = None):
         """
         Initialize the PHIL Analytics pipeline.
 
@@ -39,6 +40,8 @@ class PhilPipeline:
             max_files (int, optional): Maximum number of files to process (for testing)
             save_combined (bool): Whether to save a _combined.xlsx file for testing
             payments_filter (str, optional): Semicolon-separated string of payment numbers for filtered markdown
+            generate_markdown (bool): Whether to write the EFTs markdown files (skip when they won't be read)
+            max_workers (int, optional): Worker processes for building, tagging and rendering EFTs (None or 1 runs sequentially)
         """
         print(f"🚀 Initializing PHIL Analytics Pipeline for: {payer_folder}")
         if max_files:
@@ -48,6 +51,8 @@ class PhilPipeline:
         self.max_files = max_files
         self.save_combined = save_combined
         self.payments_filter = payments_filter
+        self.generate_markdown = generate_markdown
+        self.max_workers = max_workers
 
         # Set up paths
         if input_folder is None:
@@ -80,6 +85,7 @@ class PhilPipeline:
         self.scrubbed_file_path = None
         self.data_object = None
         self.analytics_results = None
+        self.markdown_stats = None
 
         print(f"✅ Pipeline initialized successfully")
         print(f"   📁 Input folder: {self.input_folder}")
@@ -222,7 +228,8 @@ class PhilPipeline:
         # Create data object from scrubbed Excel file
         process_limit = self.max_files * 1000 if self.max_files else None  # Estimate rows based on files
         eft_filter = [eft.strip() for eft in self.payments_filter.split(';') if eft.strip()] if self.payments_filter else None
-        self.data_object_creator = ExcelDataObjectCreator(self.scrubbed_file_path, process_limit, eft_filter)
+        self.data_object_creator = ExcelDataObjectCreator(self.scrubbed_file_path, process_limit, eft_filter,
+                                                           max_workers=self.max_workers)
         self.data_object = self.data_object_creator.create_data_object()
 
         # Get summary stats
@@ -243,7 +250,7 @@ class PhilPipeline:
         print(f"\n🏷️ Step 5: Tagging encounters")
         step_start_time = time.time()
 
-        self.encounter_tagger = EncounterTagger()
+        self.encounter_tagger = EncounterTagger(max_workers=self.max_workers)
         self.data_object = self.encounter_tagger.tag_encounters(self.data_object)
 
         step_end_time = time.time()
@@ -285,29 +292,34 @@ class PhilPipeline:
         # Get missing encounter EFTs from the data object creator
         missing_encounter_efts = self.data_object_creator.get_missing_encounter_efts() if self.data_object_creator else []
 
-        self.markdown_generator = MarkdownGenerator(self.payer_folder)
+        self.markdown_generator = MarkdownGenerator(self.payer_folder, max_workers=self.max_workers)
 
-        # Generate EFTs markdown
-        self.markdown_file_path = self.markdown_generator.generate_efts_markdown(
-            self.data_object,
-            self.output_folder,
-            missing_encounter_efts,
-            self.analytics_results  # Pass analytics results
-        )
-
-        # Generate filtered EFTs markdown if payments_filter was provided
+        # Generate EFTs markdown only when requested
+        self.markdown_file_path = ''
         self.filtered_markdown_file_path = None
-        if self.payments_filter:
-            self.filtered_markdown_file_path = self.markdown_generator.generate_filtered_efts_markdown(
+        if self.generate_markdown and self.payments_filter:
+            # Filtered EFTs markdown as well when payments_filter was provided; both files
+            # come from the same data object, so their shared sections are rendered once
+            self.markdown_file_path, self.filtered_markdown_file_path = self.markdown_generator.generate_all_efts_markdown(
                 self.data_object,
                 self.output_folder,
                 missing_encounter_efts,
                 self.analytics_results
             )
+        elif self.generate_markdown:
+            self.markdown_file_path = self.markdown_generator.generate_efts_markdown(
+                self.data_object,
+                self.output_folder,
+                missing_encounter_efts,
+                self.analytics_results  # Pass analytics results
+            )
+        else:
+            print(f"   ⏭️ Markdown generation disabled - skipping EFTs markdown files")
 
-        # Get markdown stats with missing encounter EFTs info
-        markdown_stats = self.markdown_generator.generate_summary_stats(self.data_object, missing_encounter_efts)
-        print(f"   📊 Generated EFTs markdown for {markdown_stats['total_efts']} EFTs")
+        # Get markdown stats with missing encounter EFTs info (kept for the pipeline results, the data object is final here)
+        markdown_stats = self.markdown_stats = self.markdown_generator.generate_summary_stats(self.data_object, missing_encounter_efts)
+        if self.generate_markdown:
+            print(f"   📊 Generated EFTs markdown for {markdown_stats['total_efts']} EFTs")
         print(f"   🔍 Found {markdown_stats['total_encounters_to_check']} encounters to check")
         if missing_encounter_efts:
             print(f"   ⚠️ Found {len(missing_encounter_efts)} EFTs with missing encounters")
@@ -363,9 +375,11 @@ class PhilPipeline:
         Returns:
             Dict[str, Any]: Full pipeline results and statistics
         """
-        # Get markdown stats with missing encounter EFTs
+        # Get markdown stats with missing encounter EFTs, reusing the ones computed in the markdown step
         missing_encounter_efts = self.data_object_creator.get_missing_encounter_efts() if self.data_object_creator else []
-        markdown_stats = self.markdown_generator.generate_summary_stats(self.data_object, missing_encounter_efts) if self.markdown_generator else {}
+        markdown_stats = self.markdown_stats
+        if markdown_stats is None:
+            markdown_stats = self.markdown_generator.generate_summary_stats(self.data_object, missing_encounter_efts) if self.markdown_generator else {}
 
         results = {
             'payer_folder': self.payer_folder,
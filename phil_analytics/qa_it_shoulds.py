@@ -5,6 +5,8 @@ This module defines QA specifications for different payment types and scenarios.
 Uses composable markdown strings to define expected behaviors for each payment type.
 """
 
+import io
+
 # Reusable components for building payment scenarios
 balancing = """* **IF** `{payment.is_balanced}` = `True` **AND** `{payment.is_split}` = `False`
     * It should Find the Batch
@@ -543,50 +545,50 @@ def get_all_specs():
     Returns:
         str: Complete QA specifications document
     """
-    markdown_content = []
+    markdown_content = io.StringIO()
 
-    markdown_content.append("# PHIL Analytics QA Specifications\n")
-    markdown_content.append("This document defines the expected behaviors for different payment types and scenarios.\n\n")
+    markdown_content.write("# PHIL Analytics QA Specifications\n")
+    markdown_content.write("This document defines the expected behaviors for different payment types and scenarios.\n\n")
 
     # Add payment type specifications with toggles
-    markdown_content.append("## Payment Type Specifications\n\n")
+    markdown_content.write("## Payment Type Specifications\n\n")
 
     for payment_type in ["Immediate Post", "PLA Only", "Quick Post", "Full Post", "Mixed Post"]:
-        markdown_content.append(f"{get_payment_toggle(payment_type)}\n\n")
+        markdown_content.write(f"{get_payment_toggle(payment_type)}\n\n")
 
     # Add EFT scenarios
-    markdown_content.append("## EFT Scenarios\n")
+    markdown_content.write("## EFT Scenarios\n")
     for scenario_name, spec in eft_scenarios.items():
-        markdown_content.append(f"{spec}\n\n")
+        markdown_content.write(f"{spec}\n\n")
 
     # Add special scenarios
-    markdown_content.append("## Special Handling Scenarios\n")
+    markdown_content.write("## Special Handling Scenarios\n")
     for scenario_name, spec in special_scenarios.items():
-        markdown_content.append(f"{spec}\n\n")
+        markdown_content.write(f"{spec}\n\n")
 
     # Add function "It Shoulds"
-    markdown_content.append("## Function 'It Shoulds'\n\n")
+    markdown_content.write("## Function 'It Shoulds'\n\n")
     for function_name, it_shoulds in FUNCTION_IT_SHOULDS.items():
-        markdown_content.append(f"### {function_name}\n")
+        markdown_content.write(f"### {function_name}\n")
         for it_should in it_shoulds:
-            markdown_content.append(f"* {it_should}\n")
-        markdown_content.append("\n")
+            markdown_content.write(f"* {it_should}\n")
+        markdown_content.write("\n")
 
     # Add encounter type references
-    markdown_content.append("## Encounter Type Categories\n")
-    markdown_content.append("### Not Posted List\n")
+    markdown_content.write("## Encounter Type Categories\n")
+    markdown_content.write("### Not Posted List\n")
     for item in NOT_POSTED_LIST:
-        markdown_content.append(f"* {item}\n")
+        markdown_content.write(f"* {item}\n")
 
-    markdown_content.append("\n### Check NG and Data\n")
+    markdown_content.write("\n### Check NG and Data\n")
     for item in CHECK_NG_AND_DATA:
-        markdown_content.append(f"* {item}\n")
+        markdown_content.write(f"* {item}\n")
 
-    markdown_content.append("\n### Reversals\n")
+    markdown_content.write("\n### Reversals\n")
     for item in REVERSALS:
-        markdown_content.append(f"* {item}\n")
+        markdown_content.write(f"* {item}\n")
 
-    return ''.join(markdown_content)
+    return markdown_content.getvalue()
 
 def validate_payment_against_spec(payment_data, payment_type):
     """
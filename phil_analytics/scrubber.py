@@ -9,11 +9,14 @@ import pandas as pd
 import re
 import time
 from decimal import Decimal, ROUND_HALF_UP
-from collections import defaultdict
 from typing import Dict, List
 from .exceptions import DataProcessingError
 from .utils import format_runtime, print_processing_summary, get_mapping_loader, determine_payer_folder
 
+# Dollar amounts on L6 PLA and interest payment descriptions, compiled once for the per-check loop
+PLA_AMOUNT_PATTERN = re.compile(r"Provider Level Adjustment.*\$(\-?\d+\.\d+)")
+INTEREST_AMOUNT_PATTERN = re.compile(r"Interest payment.*\$(\-?\d+\.\d+)")
+
 
 class DataCleaner:
     """
@@ -91,6 +94,7 @@ class DataCleaner:
             ((df["Description"] == "Encounter payer not found") & (df["Svc Date"] == "") & (df["Reason Cd"] == ""))
         )
 
+        # Copy so the .loc updates below write to this frame (pandas 2 warns on writes to a filtered view)
         df = df[~bad_rows].copy()
         rows_removed = rows_before - len(df)
         self.processing_stats['bad_rows_removed'] = rows_removed
@@ -106,19 +110,27 @@ class DataCleaner:
 
         rows_to_drop = []
 
-        for chk_nbr, group in df.groupby("Chk Nbr"):
-            interest_rows = group[group["Description"].str.startswith("Interest payment", na=False)]
-            pla_rows = group[
-                group["Description"].str.startswith("Provider Level Adjustment", na=False) &
-                group["Description"].str.contains("L6", na=False)
-            ]
+        # Classify interest and L6 PLA rows once over the whole frame instead of once per check
+        descriptions = df["Description"]
+        is_interest = descriptions.str.startswith("Interest payment", na=False)
+        is_l6_pla = (
+            descriptions.str.startswith("Provider Level Adjustment", na=False) &
+            descriptions.str.contains("L6", regex=False, na=False)
+        )
 
-            if len(pla_rows) != 1 or len(interest_rows) == 0:
-                continue
+        # Only checks with exactly one L6 PLA row and at least one interest row can be reconciled
+        pla_counts = is_l6_pla.groupby(df["Chk Nbr"], sort=False).sum()
+        interest_counts = is_interest.groupby(df["Chk Nbr"], sort=False).sum()
+        candidate_chk_nbrs = pla_counts.index[(pla_counts == 1) & (interest_counts > 0)]
+
+        # One grouping pass over the candidate checks; each check's rows come from its group rather than a rescan
+        for chk_nbr, group in df[df["Chk Nbr"].isin(candidate_chk_nbrs)].groupby("Chk Nbr", sort=False):
+            interest_rows = group[is_interest[group.index]]
+            pla_rows = group[is_l6_pla[group.index]]
 
             # Get PLA amount
             pla_row = pla_rows.iloc[0]
-            pla_match = re.search(r"Provider Level Adjustment.*\$(\-?\d+\.\d+)", pla_row["Description"])
+            pla_match = PLA_AMOUNT_PATTERN.search(pla_row["Description"])
             if not pla_match:
                 continue
             pla_amt = float(pla_match.group(1))
@@ -127,7 +139,7 @@ class DataCleaner:
             # Sum interest amounts
             interest_total = 0
             for _, irow in interest_rows.iterrows():
-                match = re.search(r"Interest payment.*\$(\-?\d+\.\d+)", irow["Description"])
+                match = INTEREST_AMOUNT_PATTERN.search(irow["Description"])
                 if match:
                     interest_total += float(match.group(1))
                 else:
@@ -142,12 +154,11 @@ class DataCleaner:
                 df.loc[pla_row.name, "Pat Name"] = pat_name
                 df.loc[pla_row.name, "Clm Sts Cod"] = clm_sts
 
-                # Filter all rows by Chk Nbr + Pat Name + Clm Sts Cod
-                match_rows = df[
-                    (df["Chk Nbr"] == chk_nbr) &
-                    (df["Pat Name"] == pat_name) &
-                    (df["Clm Sts Cod"] == clm_sts)
-                ]
+                # Filter all rows by Chk Nbr + Pat Name + Clm Sts Cod; the group already holds every
+                # row for this Chk Nbr, and the PLA row matches since it was just given these values
+                match_mask = (group["Pat Name"] == pat_name) & (group["Clm Sts Cod"] == clm_sts)
+                match_mask[pla_row.name] = True
+                match_rows = group[match_mask]
 
                 # Get Enc Nbr and Pol Nbr
                 enc_nbr, pol_nbr = "", ""
@@ -193,35 +204,29 @@ class DataCleaner:
 
         practice_mapping, payer_df = self.mapping_loader.load_mappings()
 
-        # Add the new columns
-        df["PAYER FOLDER"] = ""
-        df["EFT NUM"] = ""
-        df["PRACTICE ID"] = ""
-
         print(f"   🔄 Processing {len(df):,} rows...")
 
-        # Process each row
-        for idx, row in df.iterrows():
-            # Get the File column value (this contains the payment file identifier)
-            file_identifier = str(row["File"]).strip()
-
-            # Parse the payment file identifier, not the Excel filename
-            file_parts = file_identifier.split("_")
-            chk_nbr = str(row["Chk Nbr"]).strip()
-
-            # Determine payer folder, EFT number, and practice ID
-            payer_folder, eft_num, practice_id = determine_payer_folder(
-                file_parts, practice_mapping, payer_df, chk_nbr
-            )
-
-            # Set the values
-            df.at[idx, "PAYER FOLDER"] = payer_folder
-            df.at[idx, "EFT NUM"] = eft_num
-            df.at[idx, "PRACTICE ID"] = practice_id
-
-            # Progress indicator for large datasets
-            if (idx + 1) % 5000 == 0:
-                print(f"      📈 Processed {idx + 1:,} rows...")
+        # Parse the payment file identifier (the File column value), not the Excel filename
+        file_identifiers = [str(value).strip() for value in df["File"]]
+        chk_nbrs = [str(value).strip() for value in df["Chk Nbr"]]
+
+        # Rows repeat the same payment file and check number many times, so determine the
+        # payer folder, EFT number, and practice ID once per distinct (File, Chk Nbr) pair
+        resolved = {}
+        for key in zip(file_identifiers, chk_nbrs):
+            if key not in resolved:
+                file_identifier, chk_nbr = key
+                resolved[key] = determine_payer_folder(
+                    file_identifier.split("_"), practice_mapping, payer_df, chk_nbr
+                )
+
+        print(f"      📈 Resolved {len(resolved):,} distinct payment files")
+
+        # Set the values
+        row_values = [resolved[key] for key in zip(file_identifiers, chk_nbrs)]
+        df["PAYER FOLDER"] = pd.Series([payer_folder for payer_folder, _, _ in row_values], index=df.index, dtype=str)
+        df["EFT NUM"] = pd.Series([eft_num for _, eft_num, _ in row_values], index=df.index, dtype=str)
+        df["PRACTICE ID"] = pd.Series([practice_id for _, _, practice_id in row_values], index=df.index, dtype=str)
 
         # Get summary of payer folders found
         payer_folders = df["PAYER FOLDER"].value_counts()
@@ -10,6 +10,20 @@ import os
 from typing import Dict, Tuple
 from .exceptions import FileNotFoundError, MappingError
 
+try:
+    import python_calamine  # noqa: F401
+    # Rust-based XLSX reader for the mapping sheets when installed; it reads the same text as openpyxl with dtype=str
+    MAPPING_EXCEL_ENGINE = "calamine"
+except ImportError:
+    MAPPING_EXCEL_ENGINE = "openpyxl"
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings keep each column in one UTF-8 buffer, so comparisons, .str methods and grouping run in Arrow kernels
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = str
+
 
 class MappingLoader:
     """
@@ -69,10 +83,11 @@ class MappingLoader:
             practice_df = pd.read_excel(
                 self.mapping_file,
                 sheet_name="Waystar Practices",
+                engine=MAPPING_EXCEL_ENGINE,
                 dtype=str,                    # Keep all as strings
                 keep_default_na=False,        # Don't convert to NaN
-                na_filter=False              # Don't filter NA values
-            ).fillna("")
+                na_filter=False              # Don't filter NA values; blanks already read as ""
+            )
 
             self.practice_mapping = {}
             for _, row in practice_df.iterrows():
@@ -99,10 +114,15 @@ class MappingLoader:
             self.payer_df = pd.read_excel(
                 self.mapping_file,
                 sheet_name="Waystar Payers",
+                engine=MAPPING_EXCEL_ENGINE,
                 dtype=str,                    # Keep all as strings
                 keep_default_na=False,        # Don't convert to NaN
-                na_filter=False              # Don't filter NA values
-            ).fillna("")
+                na_filter=False              # Don't filter NA values; blanks already read as ""
+            )
+
+            # Strip once here so payer lookups can compare the columns directly
+            for col in self.payer_df.columns:
+                self.payer_df[col] = self.payer_df[col].str.strip()
 
             print(f"   ✅ Loaded {len(self.payer_df)} payer mappings")
             print(f"   📝 All payer data preserved as text")
@@ -165,13 +185,13 @@ class MappingLoader:
             self.load_mappings()
 
         # Filter payer mappings
-        matches = self.payer_df[self.payer_df.iloc[:, 1].str.strip() == str(waystar_id).strip()]
+        matches = self.payer_df[self.payer_df.iloc[:, 1] == str(waystar_id).strip()]
 
         if exclude_zelis:
-            matches = matches[matches.iloc[:, 2].str.strip() != "Zelis"]
+            matches = matches[matches.iloc[:, 2] != "Zelis"]
 
         if len(matches) > 0:
-            return matches.iloc[0, 2].strip()
+            return matches.iloc[0, 2]
 
         return ""
 
@@ -219,13 +239,14 @@ def determine_payer_folder(file_parts: list, practice_mapping: Dict[str, str],
     else:
         # Look up WAYSTAR ID in payer mapping to get PAYER FOLDER
         try:
+            # Mapping columns are read as text and stripped at load, so compare them directly
             non_zelis_matches = payer_df[
-                (payer_df.iloc[:, 1].astype(str).str.strip() == waystar_id) &
-                (payer_df.iloc[:, 2].astype(str).str.strip() != "Zelis")
+                (payer_df.iloc[:, 1] == waystar_id) &
+                (payer_df.iloc[:, 2] != "Zelis")
             ]
 
             if len(non_zelis_matches) > 0:
-                payer_folder = str(non_zelis_matches.iloc[0, 2]).strip()
+                payer_folder = non_zelis_matches.iloc[0, 2]
             else:
                 payer_folder = ""
 